@@ -6,8 +6,9 @@ This file contains all the constants used throughout the application,
 including colors, dimensions, and UI strings.
 """
 
-from PyQt5.QtGui import QColor, QFont
 from PyQt5.QtCore import Qt
+from functools import lru_cache
+import sys
 
 # --- Version ---
 __version__ = '0.1.0'
@@ -27,56 +28,142 @@ PEN_STYLE_NO_PEN = Qt.NoPen
 
 # --- Scene & View ---
 GRID_SIZE = 20
-GRID_COLOR_LIGHT = QColor(230, 230, 230)
 SCENE_RECT_X = -5000
 SCENE_RECT_Y = -5000
 SCENE_RECT_WIDTH = 10000
 SCENE_RECT_HEIGHT = 10000
+# Consolidated (x, y, width, height) tuple for call sites that take the
+# whole geometry at once (e.g. setSceneRect(*SCENE_RECT)).
+SCENE_RECT = (SCENE_RECT_X, SCENE_RECT_Y, SCENE_RECT_WIDTH, SCENE_RECT_HEIGHT)
 
 # View Panning and Zooming
 MIN_ZOOM_FACTOR = 0.1
 MAX_ZOOM_FACTOR = 5.0
 ZOOM_STEP_FACTOR = 1.15 # Factor for each zoom step (e.g., wheel scroll)
+ZOOM_STEP_FACTOR_INV = 1 / ZOOM_STEP_FACTOR # Precomputed reciprocal for zooming out
 FIT_VIEW_MARGIN = 50 # Margin in pixels around items when fitting to view
 SUPER_BLOCK_MARGIN_X = 120 # Horizontal margin in pixels for the super block bounding box
 SUPER_BLOCK_MARGIN_Y = 40 # Vertical margin in pixels for the super block bounding box
 INITIAL_ZOOM_FACTOR = 1.0
 FLOAT_COMPARISON_EPSILON = 1e-9 # For comparing float values like zoom levels
+# Render the view through a QOpenGLWidget viewport, offloading
+# rasterisation to the GPU. Off by default: the raster engine is fine for
+# typical diagrams and stays safe for headless and SVG-export use.
+USE_OPENGL = False
 
 # --- Item Colors ---
-# Block Colors
-BLOCK_COLOR = QColor(100, 100, 100, 180)
-BLOCK_BORDER_COLOR = QColor(50, 50, 50)
-BLOCK_HIGHLIGHT_COLOR = QColor(255, 170, 0)
-BLOCK_LOCKED_BORDER_COLOR = QColor(200, 0, 0) # A strong red for locked blocks
-BLOCK_TEXT_COLOR = QColor(255, 255, 255)
-
-# Block Pin Colors
-BLOCK_PIN_RADIUS = 6
-BLOCK_PIN_COLOR = QColor(0, 150, 200)
-BLOCK_PIN_LOCKED_COLOR = QColor(0, 100, 130) # Darker version of BLOCK_PIN_COLOR
-BLOCK_PIN_HIGHLIGHT_COLOR = QColor(255, 100, 0)
+# Colors are stored pre-packed as 32-bit ARGB integers and only turned into
+# QColor objects on first access, so importing this module does not require a
+# QGuiApplication and each distinct color is allocated exactly once. The
+# integer form feeds QColor.fromRgba(), which is the cheapest QColor
+# constructor path (a single untyped 32-bit load, no per-channel handling).
+
+def _argb(r: int, g: int, b: int, a: int = 255) -> int:
+    """Packs RGBA channels into a single 32-bit ARGB integer."""
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+def _darker(argb: int, factor: float) -> int:
+    """Returns a darkened variant of a packed ARGB color, preserving alpha."""
+    a = (argb >> 24) & 0xFF
+    r = int(((argb >> 16) & 0xFF) * factor)
+    g = int(((argb >> 8) & 0xFF) * factor)
+    b = int((argb & 0xFF) * factor)
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+_LOCKED_DARKEN_FACTOR = 0.66 # Darkening applied to pin colors to derive their locked variants
+
+_COLOR_TABLE = {
+    # Scene & View
+    'GRID_COLOR_LIGHT': _argb(230, 230, 230),
+
+    # Block Colors
+    'BLOCK_COLOR': _argb(100, 100, 100, 180),
+    'BLOCK_BORDER_COLOR': _argb(50, 50, 50),
+    'BLOCK_HIGHLIGHT_COLOR': _argb(255, 170, 0),
+    'BLOCK_LOCKED_BORDER_COLOR': _argb(200, 0, 0), # A strong red for locked blocks
+    'BLOCK_TEXT_COLOR': _argb(255, 255, 255),
+
+    # Block Pin Colors
+    'BLOCK_PIN_COLOR': _argb(0, 150, 200),
+    'BLOCK_PIN_HIGHLIGHT_COLOR': _argb(255, 100, 0),
+
+    # Diagram Pin Colors
+    'DIAGRAM_PIN_COLOR': _argb(0, 180, 100),
+    'DIAGRAM_PIN_HIGHLIGHT_COLOR': _argb(100, 255, 150),
+    'DIAGRAM_OUTPUT_PIN_COLOR': _argb(200, 0, 150),
+    'DIAGRAM_OUTPUT_PIN_HIGHLIGHT_COLOR': _argb(255, 100, 200),
+    'DIAGRAM_PIN_TEXT_COLOR': _argb(0, 0, 0),
+
+    # Wire Colors
+    'WIRE_COLOR': _argb(0, 0, 0),
+    'WIRE_HIGHLIGHT_COLOR': _argb(255, 0, 0),
+    'WIRE_LOCKED_COLOR': _argb(0, 0, 200), # A strong blue for locked wires
+
+    # Debug
+    'DEBUG_BBOX_COLOR': _argb(0, 0, 0),
+}
+
+# Locked pin colors are darkened variants of the base pin colors, derived
+# once at table build time instead of being hand-coded literals.
+_COLOR_TABLE.update({
+    'BLOCK_PIN_LOCKED_COLOR': _darker(_COLOR_TABLE['BLOCK_PIN_COLOR'], _LOCKED_DARKEN_FACTOR),
+    'DIAGRAM_PIN_LOCKED_COLOR': _darker(_COLOR_TABLE['DIAGRAM_PIN_COLOR'], _LOCKED_DARKEN_FACTOR),
+    'DIAGRAM_OUTPUT_PIN_LOCKED_COLOR': _darker(_COLOR_TABLE['DIAGRAM_OUTPUT_PIN_COLOR'], _LOCKED_DARKEN_FACTOR),
+})
+
+@lru_cache(maxsize=None)
+def color(name: str) -> 'QColor':
+    """
+    Returns the QColor for a named color constant, constructing it lazily.
+
+    The QColor is built on first access and cached, so repeated lookups
+    (e.g. in render loops) reuse the same instance. QtGui is imported
+    here rather than at module level so that consumers of the plain
+    string/dimension constants never pay for a Qt load.
+    """
+    from PyQt5.QtGui import QColor
+    return QColor.fromRgba(_COLOR_TABLE[name])
+
+def __getattr__(name: str):
+    """
+    Module-level attribute hook (PEP 562) serving lazily built Qt values.
+
+    Colors and the title font weight require QtGui; resolving them here
+    keeps the module importable without Qt for non-GUI consumers.
+    """
+    if name in _COLOR_TABLE:
+        return color(name)
+    if name == 'FONT_WEIGHT_BLOCK_TITLE':
+        from PyQt5.QtGui import QFont
+        globals()[name] = QFont.Bold
+        return QFont.Bold
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Diagram Pin Colors
+BLOCK_PIN_RADIUS = 6
 DIAGRAM_PIN_RADIUS = 6
-DIAGRAM_PIN_COLOR = QColor(0, 180, 100)
-DIAGRAM_PIN_LOCKED_COLOR = QColor(0, 120, 70) # Darker version of DIAGRAM_PIN_COLOR
-DIAGRAM_PIN_HIGHLIGHT_COLOR = QColor(100, 255, 150)
-DIAGRAM_OUTPUT_PIN_COLOR = QColor(200, 0, 150)
-DIAGRAM_OUTPUT_PIN_LOCKED_COLOR = QColor(130, 0, 100) # Darker version of DIAGRAM_OUTPUT_PIN_COLOR
-DIAGRAM_OUTPUT_PIN_HIGHLIGHT_COLOR = QColor(255, 100, 200)
-DIAGRAM_PIN_TEXT_COLOR = QColor(0, 0, 0)
-
-# Wire Colors
-WIRE_COLOR = QColor(0, 0, 0)
-WIRE_HIGHLIGHT_COLOR = QColor(255, 0, 0)
-WIRE_LOCKED_COLOR = QColor(0, 0, 200) # A strong blue for locked wires
 
 # --- Fonts ---
 FONT_SIZE_BLOCK_PIN = 8
 FONT_SIZE_DIAGRAM_PIN = 9
 FONT_SIZE_BLOCK_TITLE = 10
-FONT_WEIGHT_BLOCK_TITLE = QFont.Bold
+# FONT_WEIGHT_BLOCK_TITLE (QFont.Bold) is served lazily by the module
+# __getattr__ above so importing conf does not require QtGui.
+
+@lru_cache(maxsize=None)
+def get_font(point_size: int, weight: int = None) -> 'QFont':
+    """
+    Returns a shared QFont for the given point size and optional weight.
+
+    Fonts are immutable from the callers' perspective once applied to a
+    text item, so a single cached instance per (size, weight) pair is
+    reused instead of constructing a new QFont for every item.
+    """
+    from PyQt5.QtGui import QFont
+    font = QFont()
+    font.setPointSize(point_size)
+    if weight is not None:
+        font.setWeight(weight)
+    return font
 
 # --- Item Dimensions & Spacing ---
 # General
@@ -105,6 +192,7 @@ DIAGRAM_PIN_VERTICAL_SPACING = GRID_SIZE * 2 # Vertical spacing between diagram
 WIRE_STUB_LENGTH = GRID_SIZE # The minimum horizontal length of the "stub" coming out of a pin
 BEZIER_DX_FACTOR = 0.5  # Multiplier for horizontal distance in Bezier calculation. Affects curve "roundness".
 BEZIER_STUB_FACTOR = 3.0  # Multiplier for stub length in Bezier calculation.
+BEZIER_MIN_OFFSET = WIRE_STUB_LENGTH * BEZIER_STUB_FACTOR  # Folded constant: minimum control-point offset in pixels.
 WIRE_CLICKABLE_WIDTH = 10 # Width of the clickable area around a wire
 
 # --- Auto-Placement ---
@@ -127,7 +215,12 @@ OPTIMIZER_SA_DEFAULT_INITIAL_TEMP = 10.0
 OPTIMIZER_SA_DEFAULT_COOLING_RATE = 0.995
 OPTIMIZER_SA_DEFAULT_MOVE_STEP_GRID_UNITS = 8
 OPTIMIZER_SA_DEFAULT_REPORTING_INTERVAL = 50
+OPTIMIZER_SA_DEFAULT_N_RESTARTS = 1 # Number of independent annealing runs; the best result is kept
 OPTIMIZER_SA_MIN_TEMPERATURE = 1e-9 # Temperature at which it's considered "frozen"
+# Cost deltas beyond temperature * this factor have an acceptance
+# probability below exp(-50) and are treated as certain rejections, which
+# lets the cost evaluation stop early. See _apply_and_evaluate_move.
+OPTIMIZER_SA_REJECT_DELTA_FACTOR = 50.0
 
 # Whether to use detailed area calculation for wire intersections or a simple boolean check.
 USE_DETAILED_INTERSECTION_CHECK = False
@@ -138,9 +231,12 @@ MAIN_WINDOW_DEFAULT_Y = 100
 MAIN_WINDOW_DEFAULT_WIDTH = 1200
 MAIN_WINDOW_DEFAULT_HEIGHT = 800
 STATUS_BAR_TIMEOUT_MS = 5000
+# Minimum interval between progress-bar repaints. Optimizers report every
+# iteration; anything faster than ~60 Hz is invisible and just costs
+# repaints.
+PROGRESS_BAR_MIN_UPDATE_INTERVAL_MS = 16
 
 # --- Debug ---
-DEBUG_BBOX_COLOR = QColor(0, 0, 0)
 DEBUG_BBOX_PEN_STYLE = Qt.DashLine
 DEBUG_BBOX_PEN_WIDTH = 1
 
@@ -151,6 +247,7 @@ class Key:
     BLOCK = 'block'
     PIN_TYPE = 'pin_type'
     PINS = 'pins'
+    ORDER = 'order' # Current pin order carried by reorder moves
     # For JSON serialization
     FORMAT_VERSION_KEY = "format_version"
     PART_KEY = "part"
@@ -275,6 +372,8 @@ class UI:
         OPTIMIZER_NOT_CONFIGURED = "Error: No optimizer function has been provided."
         OPTIMIZER_RHC_PARAMS = "Randomized Hill Climbing parameters: iterations={iterations}, move_step_grid_units={move_step_grid_units}."
         OPTIMIZER_SA_PARAMS = "Simulated Annealing parameters: initial_temp={initial_temp}, cooling_rate={cooling_rate}."
+        OPTIMIZER_SA_RESTART = "Simulated Annealing restart {restart}/{total_restarts}..."
+        OPTIMIZER_SA_BEST_RESTART = "Best of {total_restarts} annealing runs kept. Cost: {cost:.2f}"
         OPTIMIZER_ACCEPTED_BAD_MOVE = "Accepted non-improving move with cost {new_cost:.2f} (delta: {delta:.2f}) at temp {temperature:.2f}."
         OPTIMIZER_CANCELLED = "Optimization cancelled by user."
         OPTIMIZER_UNEXPECTED_ERROR_LOG = "An unexpected error occurred during optimization: {error}"
@@ -289,4 +388,61 @@ class UI:
         NOT_IMPLEMENTED_ERROR_SUBCLASS = "Subclasses must implement this method."
         QAPP_INSTANCE_REQUIRED = "A QApplication instance must be created before calling start()."
         PIN_ALREADY_EXISTS = "A pin named '{pin_name}' already exists on this block."
-        ITEM_NAME_ALREADY_EXISTS = "An item of type '{item_type}' with the name '{name}' already exists."
\ No newline at end of file
+        ITEM_NAME_ALREADY_EXISTS = "An item of type '{item_type}' with the name '{name}' already exists."
+def _intern_str_constants(namespace: type) -> None:
+    """
+    Interns every string constant in a constants class, recursing into
+    nested classes.
+
+    Interned strings are compared by identity first, which makes the
+    dictionary lookups and key comparisons that use these constants
+    (e.g. the optimizer move dictionaries keyed by `Key.*`) cheaper.
+    """
+    for attr_name, value in vars(namespace).copy().items():
+        if attr_name.startswith('__'):
+            continue
+        if isinstance(value, str):
+            setattr(namespace, attr_name, sys.intern(value))
+        elif isinstance(value, type):
+            _intern_str_constants(value)
+
+_intern_str_constants(Key)
+_intern_str_constants(UI)
+
+# --- Log Template Rendering ---
+# str.format re-parses its template on every call. The helpers below cache
+# the parsed token stream per template so hot paths (the optimizer loop and
+# cost evaluation) only pay for value conversion, not re-tokenization.
+import string
+
+_FORMATTER = string.Formatter()
+
+@lru_cache(maxsize=None)
+def _parsed_template(template: str) -> tuple:
+    """Parses a str.format template once and caches the token stream."""
+    return tuple(_FORMATTER.parse(template))
+
+def render_log(template: str, **kwargs) -> str:
+    """
+    Renders a `UI.Log` template with the given fields.
+
+    Equivalent to `template.format(**kwargs)`, but reuses a cached parse of
+    the template instead of re-tokenizing the format string on every call.
+
+    Args:
+        template (str): The format template, usually a `UI.Log` constant.
+        **kwargs: The field values referenced by the template.
+
+    Returns:
+        str: The rendered message.
+    """
+    parts = []
+    for literal, field, spec, conversion in _parsed_template(template):
+        if literal:
+            parts.append(literal)
+        if field is not None:
+            value, _ = _FORMATTER.get_field(field, (), kwargs)
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec))
+    return ''.join(parts)
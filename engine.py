@@ -24,27 +24,114 @@ from PyQt5.QtWidgets import (
     QStyleOptionGraphicsItem, QWidget, QFileDialog
 )
 from PyQt5.QtCore import ( # Added QObject to imports
-    Qt, QPointF, QRectF, QLineF, QPoint,
+    Qt, QPointF, QRectF, QLineF, QPoint, QTimer, QElapsedTimer,
     pyqtSignal)
 from PyQt5.QtGui import (
-    QPainter, QPen, QBrush, QFont, QPainterPath, QPolygonF, QPainterPathStroker, QColor, QKeyEvent, QWheelEvent, QMouseEvent, QCloseEvent, QTransform
+    QPainter, QPen, QBrush, QPainterPath, QPolygonF, QPainterPathStroker, QColor, QKeyEvent, QWheelEvent, QMouseEvent, QCloseEvent, QTransform
 )
 from PyQt5.QtSvg import (
     QSvgGenerator
 )
 import diagrams.conf as conf
 from enum import Enum
+import contextlib
 import functools
-from typing import Optional, Callable, Dict, Tuple, Union, List, Any
+from typing import Optional, Callable, Dict, Tuple, Union, List, Any, Sequence
 import math # For math.ceil
 import itertools
 import traceback
 
+# Hot-path constants hoisted from conf once at import time. itemChange runs
+# for every pixel of a drag and the placement search for every candidate
+# cell; a module-global read is one dict probe instead of two.
+_GRID_SIZE = conf.GRID_SIZE
+_PLACEMENT_MAX_RADIUS = conf.BLOCK_PLACEMENT_SEARCH_MAX_RADIUS
+
+def _make_grid_snapper(grid: int) -> Callable[[float], float]:
+    """
+    Builds the grid-snapping function used on the drag hot path.
+
+    When the grid pitch is an integer power of two the snap reduces to an
+    integer add and mask (round-half-up semantics); otherwise the generic
+    round/divide formula is used. Either way the pitch is bound into the
+    closure, so the per-call cost is pure arithmetic.
+
+    Args:
+        grid (int): The grid pitch in pixels.
+
+    Returns:
+        Callable[[float], float]: A function mapping a coordinate to the
+        nearest grid multiple.
+    """
+    if isinstance(grid, int) and grid > 0 and grid & (grid - 1) == 0:
+        half = grid >> 1
+        mask = ~(grid - 1)
+        def snap(value: float) -> float:
+            return float((math.floor(value) + half) & mask)
+    else:
+        def snap(value: float) -> float:
+            return round(value / grid) * grid
+    return snap
+
+_snap_to_grid = _make_grid_snapper(_GRID_SIZE)
+
+def _make_grid_ceil_snapper(grid: int) -> Callable[[float], float]:
+    """
+    Builds a function that snaps a value up to the next grid multiple.
+
+    Like `_make_grid_snapper` but with ceiling semantics, as used when
+    sizing blocks (a block must never shrink below its content). Power-of-
+    two pitches reduce to an integer add and mask; other pitches use the
+    generic ceil/divide formula.
+
+    Args:
+        grid (int): The grid pitch in pixels.
+
+    Returns:
+        Callable[[float], float]: A function mapping a value to the next
+        grid multiple at or above it.
+    """
+    if isinstance(grid, int) and grid > 0 and grid & (grid - 1) == 0:
+        bump = grid - 1
+        mask = ~bump
+        def snap_up(value: float) -> float:
+            return float((math.ceil(value) + bump) & mask)
+    else:
+        def snap_up(value: float) -> float:
+            return math.ceil(value / grid) * grid
+    return snap_up
+
+_snap_up_to_grid = _make_grid_ceil_snapper(_GRID_SIZE)
+
+@functools.lru_cache(maxsize=None)
+def _shared_pen(color_name: str, width: int) -> QPen:
+    """
+    Returns a shared QPen for a named conf colour and width.
+
+    Items only ever swap between their pens and never mutate them, so all
+    items with the same (colour, width) style can safely share a single
+    instance. This replaces the three pens each Wire, Block and DiagramPin
+    used to allocate with one pen per distinct style for the whole scene.
+
+    Args:
+        color_name (str): The conf colour constant name, e.g. 'WIRE_COLOR'.
+        width (int): The pen width in pixels.
+
+    Returns:
+        QPen: The shared pen for that style.
+    """
+    return QPen(conf.color(color_name), width)
+
 class PinType(Enum):
     """Defines the type of a pin, either as an input or an output."""
     INPUT = 0
     OUTPUT = 1
 
+# Horizontal direction a wire's control point extends from a pin of the
+# given type: away from outputs, towards inputs. The None entry is the
+# fallback for wires whose end pin type is unknown.
+_PIN_SIGN = {PinType.OUTPUT: 1.0, PinType.INPUT: -1.0, None: -1.0}
+
 class MoveType(Enum):
     """Defines the type of optimization move."""
     MOVE_BLOCK = 0
@@ -69,7 +156,41 @@ class PinMixin:
         self.parent_block = parent_block
         self.pin_type = pin_type
         self._name = name
-        self.wires: List['Wire'] = []
+        # Registered wires. An insertion-ordered dict used as a set, so
+        # membership tests and removals are O(1) even on densely connected
+        # pins; iteration and len() behave like the list it replaces.
+        self.wires: Dict['Wire', None] = {}
+        # Immutable snapshot of `wires`, refreshed by add_wire/remove_wire.
+        # Hot paths iterate this tuple; tuples iterate faster than lists
+        # and the snapshot can never be mutated mid-iteration.
+        self._wires_tuple: Tuple['Wire', ...] = ()
+        self._locked_cache = False
+
+    def add_wire(self, wire: 'Wire') -> None:
+        """
+        Registers a wire as connected to this pin.
+
+        A no-op if the wire is already registered.
+
+        Args:
+            wire (Wire): The wire to register.
+        """
+        if wire not in self.wires:
+            self.wires[wire] = None
+            self._wires_tuple = tuple(self.wires)
+
+    def remove_wire(self, wire: 'Wire') -> None:
+        """
+        Unregisters a wire from this pin.
+
+        A no-op if the wire is not registered.
+
+        Args:
+            wire (Wire): The wire to unregister.
+        """
+        if wire in self.wires:
+            del self.wires[wire]
+            self._wires_tuple = tuple(self.wires)
 
     def scenePos(self) -> QPointF:
         """
@@ -82,12 +203,20 @@ class PinMixin:
 
     @property
     def is_locked(self) -> bool:
-        """A pin is considered locked if any of its connected wires are locked."""
-        return any(wire.is_locked for wire in self.wires)
+        """
+        A pin is considered locked if any of its connected wires are locked.
+
+        The value is cached and refreshed by `update_lock_state`, which every
+        lock-affecting path (wire lock/unlock, connect, disconnect) already
+        calls, so reading it on the hover/paint path costs one attribute
+        lookup instead of a walk over the wires.
+        """
+        return self._locked_cache
 
     def update_lock_state(self) -> None:
         """Updates the pin's appearance and movability based on its lock state."""
-        is_locked = self.is_locked # Check the dynamic property
+        # Recompute the cached lock state from the connected wires.
+        self._locked_cache = is_locked = any(wire.is_locked for wire in self._wires_tuple)
         self.setFlag(QGraphicsItem.ItemIsMovable, not is_locked)
         if is_locked:
             self.setBrush(QBrush(self.locked_color))
@@ -97,8 +226,19 @@ class PinMixin:
         self.update()
 
     def update_connected_wires(self) -> None:
-        """Updates the geometry of all wires connected to this pin."""
-        for wire in self.wires:
+        """
+        Updates the geometry of all wires connected to this pin.
+
+        While the scene is batching (during a drag mouse-move), the wires
+        are only queued; the scene recomputes each queued wire once after
+        all moved items have settled.
+        """
+        scene = self.scene()
+        pending = getattr(scene, '_pending_wire_updates', None)
+        if pending is not None:
+            pending.update(self._wires_tuple)
+            return
+        for wire in self._wires_tuple:
             wire.update_geometry()
 
 def single_selection_only(func: Callable) -> Callable:
@@ -129,15 +269,182 @@ def _is_rect_overlapping(scene: QGraphicsScene, rect: QRectF, item_to_ignore: QG
     Returns:
         bool: True if the rectangle overlaps with an existing item, False otherwise.
     """
-    for item in scene.items():
-        if item == item_to_ignore:
+    # Let the scene's spatial index (BSP tree) find the items touching the
+    # rect; only the handful of hits are then filtered in Python instead of
+    # walking every item in the scene.
+    # We only care about collisions with other Blocks and DiagramPins; the
+    # scene tracks those in a set so the filter is a membership test.
+    obstacles = getattr(scene, '_placement_obstacles', None)
+    for item in scene.items(rect, Qt.IntersectsItemBoundingRect):
+        if item is item_to_ignore or item.parentItem() is item_to_ignore:
             continue
-        # We only care about collisions with other Blocks and DiagramPins
-        if isinstance(item, (Block, DiagramPin)):
-            if rect.intersects(item.sceneBoundingRect()):
-                return True
+        if (item in obstacles) if obstacles is not None else isinstance(item, (Block, DiagramPin)):
+            return True
     return False
 
+def _spiral_offsets(step: float, max_radius: float):
+    """
+    Generates (x, y) offsets walking a square spiral outwards from the origin.
+
+    Yields offsets in ring order (nearest first) until the squared distance
+    from the origin exceeds `max_radius` squared. Offsets are produced
+    lazily; the search normally terminates after a handful of rings, so the
+    full spiral (which would be ~1M cells at the configured max radius) is
+    never materialized.
+
+    Args:
+        step (float): The distance between adjacent spiral cells,
+            normally the grid size.
+        max_radius (float): The maximum search radius.
+
+    Yields:
+        Tuple[float, float]: The next (x, y) offset on the spiral.
+    """
+    # Walk legs of length 1, 1, 2, 2, 3, 3, ... rotating through the four
+    # directions. The leg counter replaces the corner-detection comparisons
+    # against (x, y) that the previous implementation re-evaluated on every
+    # step, so each step is two adds and a decrement.
+    directions = ((step, 0), (0, -step), (-step, 0), (0, step))
+    x, y = 0, 0
+    max_radius_sq = max_radius ** 2
+    leg_length = 1
+    direction_index = 0
+    while True:
+        for _ in range(2): # The leg length grows every two turns.
+            dx, dy = directions[direction_index]
+            for _ in range(leg_length):
+                x += dx
+                y += dy
+                if x*x + y*y >= max_radius_sq:
+                    return
+                yield x, y
+            direction_index = (direction_index + 1) & 3
+        leg_length += 1
+
+def _collect_obstacle_rects(scene: QGraphicsScene, item_to_ignore: QGraphicsItem, within: Optional[QRectF] = None) -> List[QRectF]:
+    """
+    Collects the scene bounding rects of all placement obstacles.
+
+    Placement only needs to avoid Blocks and DiagramPins; their rects are
+    gathered once so a placement search can test many candidate positions
+    without re-scanning the scene per candidate.
+
+    Args:
+        scene (QGraphicsScene): The scene to collect from.
+        item_to_ignore (QGraphicsItem): The item being placed, excluded
+            from the result.
+        within (QRectF, optional): When given, only items intersecting this
+            region are collected (resolved through the scene's spatial
+            index). Obstacles outside it can never collide with a candidate.
+
+    Returns:
+        List[QRectF]: The obstacle bounding rects in scene coordinates.
+    """
+    obstacles = getattr(scene, '_placement_obstacles', None)
+    if obstacles is not None:
+        # The scene already knows its obstacles; filter against the search
+        # region directly, no isinstance dispatch needed.
+        rects = []
+        for item in obstacles:
+            if item is item_to_ignore:
+                continue
+            rect = item.sceneBoundingRect()
+            if within is None or within.intersects(rect):
+                rects.append(rect)
+        return rects
+    if within is not None:
+        items = scene.items(within, Qt.IntersectsItemBoundingRect)
+    else:
+        items = scene.items()
+    return [item.sceneBoundingRect() for item in items
+            if item is not item_to_ignore and isinstance(item, (Block, DiagramPin))]
+
+def _grid_cells(rect: QRectF, cell: float):
+    """
+    Yields the (column, row) key of every uniform-grid cell a rect covers.
+
+    Shared by the spatial hashes used for placement queries and for the
+    intersection cost metric.
+    """
+    x0 = math.floor(rect.left() / cell)
+    x1 = math.floor(rect.right() / cell)
+    y0 = math.floor(rect.top() / cell)
+    y1 = math.floor(rect.bottom() / cell)
+    for cx in range(x0, x1 + 1):
+        for cy in range(y0, y1 + 1):
+            yield (cx, cy)
+
+def _bucket_rects_by_cell(rects: List[QRectF], cell: float) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Buckets rect indices by the uniform-grid cells they cover.
+
+    An index-payload variant of _PlacementGrid for callers that need the
+    candidates sharing a cell rather than a boolean overlap answer.
+
+    Args:
+        rects (List[QRectF]): The rectangles to bucket.
+        cell (float): The side length of a bucket cell.
+
+    Returns:
+        Dict[Tuple[int, int], List[int]]: Cell key to indices into `rects`.
+    """
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    for index, rect in enumerate(rects):
+        for key in _grid_cells(rect, cell):
+            buckets.setdefault(key, []).append(index)
+    return buckets
+
+class _PlacementGrid:
+    """
+    A uniform spatial hash over obstacle rectangles for placement queries.
+
+    Obstacle rects are bucketed by the coarse grid cells they cover, so an
+    overlap query only tests the rects sharing a cell with the candidate
+    instead of the whole obstacle list. The scene is already grid-quantized,
+    which makes a uniform grid a natural fit; cells span several scene grid
+    units so a typical block covers only a handful of buckets.
+    """
+
+    def __init__(self, cell_size: Optional[float] = None) -> None:
+        """
+        Initializes an empty grid.
+
+        Args:
+            cell_size (float, optional): The side length of a bucket cell.
+                Defaults to a multiple of the scene grid size.
+        """
+        self.cell_size = cell_size if cell_size is not None else conf.GRID_SIZE * 8
+        self._buckets: Dict[Tuple[int, int], List[QRectF]] = {}
+
+    def _cells(self, rect: QRectF):
+        """Yields the (column, row) key of every cell the rect covers."""
+        return _grid_cells(rect, self.cell_size)
+
+    def insert(self, rect: QRectF) -> None:
+        """Adds an obstacle rect to every bucket it covers."""
+        buckets = self._buckets
+        for key in self._cells(rect):
+            buckets.setdefault(key, []).append(rect)
+
+    def overlaps(self, rect: QRectF) -> bool:
+        """
+        Checks whether the rect intersects any inserted obstacle.
+
+        Args:
+            rect (QRectF): The candidate rectangle in scene coordinates.
+
+        Returns:
+            bool: True if any obstacle intersects the rect.
+        """
+        buckets = self._buckets
+        for key in self._cells(rect):
+            bucket = buckets.get(key)
+            if bucket:
+                for obstacle in bucket:
+                    if rect.intersects(obstacle):
+                        return True
+        return False
+
 def find_safe_placement(scene: QGraphicsScene,
                         item_width: float,
                         item_height: float,
@@ -170,34 +477,40 @@ def find_safe_placement(scene: QGraphicsScene,
 
     # Start at the hint position, snapped to the grid
     if is_centered:
-        start_pos = QPointF(round(search_center_hint.x() / conf.GRID_SIZE) * conf.GRID_SIZE, round(search_center_hint.y() / conf.GRID_SIZE) * conf.GRID_SIZE)
+        start_pos = QPointF(round(search_center_hint.x() / _GRID_SIZE) * _GRID_SIZE, round(search_center_hint.y() / _GRID_SIZE) * _GRID_SIZE)
     else:
-        start_pos = QPointF(round((search_center_hint.x() - item_width / 2) / conf.GRID_SIZE) * conf.GRID_SIZE, round((search_center_hint.y() - item_height / 2) / conf.GRID_SIZE) * conf.GRID_SIZE)
+        start_pos = QPointF(round((search_center_hint.x() - item_width / 2) / _GRID_SIZE) * _GRID_SIZE, round((search_center_hint.y() - item_height / 2) / _GRID_SIZE) * _GRID_SIZE)
+
+    # Gather the obstacle rects once; every candidate position is then a
+    # cheap rect-vs-rect test instead of a full scene scan. Only obstacles
+    # inside the search region (the spiral's reach plus the item's size)
+    # can ever collide with a candidate, so the collection is bounded too.
+    search_reach = _PLACEMENT_MAX_RADIUS + max(item_width, item_height)
+    search_region = QRectF(start_pos.x() - search_reach, start_pos.y() - search_reach,
+                           2 * search_reach, 2 * search_reach)
+    obstacle_rects = _collect_obstacle_rects(scene, item_to_ignore, within=search_region)
+
+    # Bucket the obstacles in a spatial hash so each candidate only tests
+    # the rects in its own neighbourhood rather than the whole list.
+    grid = _PlacementGrid()
+    for rect in obstacle_rects:
+        grid.insert(rect)
+
+    # Offsets from the candidate position to its top-left corner.
+    corner_dx = -item_width / 2 if is_centered else 0.0
+    corner_dy = -item_height / 2 if is_centered else 0.0
+
+    def is_free(pos_x: float, pos_y: float) -> bool:
+        """Checks a candidate position against the collected obstacles."""
+        return not grid.overlaps(QRectF(pos_x + corner_dx, pos_y + corner_dy, item_width, item_height))
 
     # Check the initial position first before starting the spiral.
-    initial_top_left = QPointF(start_pos.x() - item_width / 2, start_pos.y() - item_height / 2) if is_centered else start_pos
-    initial_rect = QRectF(initial_top_left.x(), initial_top_left.y(), item_width, item_height)
-    if not _is_rect_overlapping(scene, initial_rect, item_to_ignore):
+    if is_free(start_pos.x(), start_pos.y()):
         return start_pos
 
-    x, y = 0, 0
-    dx, dy = 0, -conf.GRID_SIZE
-    max_radius_sq = conf.BLOCK_PLACEMENT_SEARCH_MAX_RADIUS ** 2
-
-    while x*x + y*y < max_radius_sq:
-        # This condition checks if we are at a "corner" of the spiral,
-        # which is where we need to turn. It generates the sequence:
-        # (right, down, left, left, up, up, right, right, right...)
-        if x == y or (x < 0 and x == -y) or (x > 0 and x == 1 - y):
-            dx, dy = -dy, dx
-        x, y = x + dx, y + dy
-
-        current_pos = QPointF(start_pos.x() + x, start_pos.y() + y)
-        potential_top_left = QPointF(current_pos.x() - item_width / 2, current_pos.y() - item_height / 2) if is_centered else current_pos
-        potential_rect = QRectF(potential_top_left.x(), potential_top_left.y(), item_width, item_height)
-
-        if not _is_rect_overlapping(scene, potential_rect, item_to_ignore):
-            return current_pos # Success
+    for x, y in _spiral_offsets(_GRID_SIZE, _PLACEMENT_MAX_RADIUS):
+        if is_free(start_pos.x() + x, start_pos.y() + y):
+            return QPointF(start_pos.x() + x, start_pos.y() + y) # Success
 
     # If even the spiral search fails (scene is extremely crowded), return the
     # original hint position as a last resort.
@@ -253,9 +566,7 @@ class SelectableMovableItemMixin:
         """
         if change == QGraphicsItem.ItemPositionChange and self.scene():
             new_pos = value
-            snapped_x = round(new_pos.x() / conf.GRID_SIZE) * conf.GRID_SIZE
-            snapped_y = round(new_pos.y() / conf.GRID_SIZE) * conf.GRID_SIZE
-            return QPointF(snapped_x, snapped_y)
+            return QPointF(_snap_to_grid(new_pos.x()), _snap_to_grid(new_pos.y()))
         elif change == QGraphicsItem.ItemPositionHasChanged:
             self.update_connected_wires()
         elif change == QGraphicsItem.ItemSelectedChange:
@@ -271,20 +582,20 @@ class HoverHighlightMixin:
     """
     A mixin class to provide hover highlighting functionality.
 
-    This mixin assumes the class has `color` and `highlight_color` attributes
-    and that hover events have been enabled on the item.
+    This mixin assumes the class has `color`, `highlight_color`,
+    `locked_color` and `is_locked` attributes (all pin classes do) and
+    that hover events have been enabled on the item.
     """
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
         """
         Highlights the item by changing its brush to the highlight color.
 
-        If the item has an 'is_locked' attribute and it is True, the
-        highlighting is skipped.
+        If the item is locked, the highlighting is skipped.
 
         Args:
             event (QGraphicsSceneHoverEvent): The hover event.
         """
-        if hasattr(self, 'is_locked') and self.is_locked:
+        if self.is_locked:
             super().hoverEnterEvent(event)
             return # Do not highlight if locked
         self.setBrush(QBrush(self.highlight_color))
@@ -296,10 +607,9 @@ class HoverHighlightMixin:
 
         If the item is locked, the brush is set to its 'locked_color' instead.
         """
-        if hasattr(self, 'is_locked') and self.is_locked:
+        if self.is_locked:
             # If it's locked, ensure it has the locked brush.
-            if hasattr(self, 'locked_color'):
-                self.setBrush(QBrush(self.locked_color))
+            self.setBrush(QBrush(self.locked_color))
             super().hoverLeaveEvent(event)
             return
         self.setBrush(QBrush(self.color))
@@ -350,10 +660,12 @@ class BlockPin(PinMixin, HoverHighlightMixin, QGraphicsEllipseItem):
 
         self.text_item = QGraphicsTextItem(self.name, self)
         self.text_item.setDefaultTextColor(conf.BLOCK_TEXT_COLOR)
-        font = QFont()
-        font.setPointSize(conf.FONT_SIZE_BLOCK_PIN)
-        self.text_item.setFont(font)
+        self.text_item.setFont(conf.get_font(conf.FONT_SIZE_BLOCK_PIN))
         self.text_item.setZValue(conf.Z_VALUE_TEXT) # Text on top of pin
+        # Labels are purely decorative; keep them out of mouse dispatch so
+        # clicks land on the pin underneath, not the label.
+        self.text_item.setAcceptedMouseButtons(Qt.NoButton)
+        self._cache_text_metrics()
 
         self.update_lock_state()
         self.update_position()
@@ -363,27 +675,55 @@ class BlockPin(PinMixin, HoverHighlightMixin, QGraphicsEllipseItem):
         """Returns the name of the pin."""
         return self._name
 
+    def _cache_text_metrics(self) -> None:
+        """
+        Caches the label placement offsets.
+
+        The offsets depend only on the label's rendered size and the pin
+        radius/padding constants; block pin labels never change after
+        creation, so they are computed once here instead of re-deriving
+        them from the text bounding rect on every relayout.
+        """
+        text_rect = self.text_item.boundingRect()
+        self._text_y = -text_rect.height() / 2
+        self._text_left_x = conf.BLOCK_PIN_RADIUS + conf.BLOCK_PIN_TEXT_PADDING
+        self._text_right_x = -conf.BLOCK_PIN_RADIUS - conf.BLOCK_PIN_TEXT_PADDING - text_rect.width()
+        # Horizontal space this pin's label needs inside the block:
+        # pin circle radius + padding to text + text width + internal padding.
+        # Used by the block's auto-width calculation.
+        self._label_span = (conf.BLOCK_PIN_RADIUS + conf.BLOCK_PIN_TEXT_PADDING
+                            + text_rect.width() + conf.MIN_BLOCK_INTERNAL_PADDING)
+
+    def _place(self, x: float, y: float) -> None:
+        """
+        Sets the pin and label positions directly.
+
+        This is the shared placement primitive used both by
+        `update_position` (single pin) and the block's batch relayout,
+        which precomputes the coordinates for all pins at once.
+
+        Args:
+            x (float): The pin's x-coordinate in block coordinates.
+            y (float): The pin's y-coordinate in block coordinates.
+        """
+        self.setPos(x, y)
+        if self.pin_type == PinType.INPUT:
+            self.text_item.setPos(self._text_left_x, self._text_y)
+        else: # OUTPUT
+            self.text_item.setPos(self._text_right_x, self._text_y)
+
     def update_position(self) -> None:
         """
         Recalculates and sets the position of the pin and its text.
-        
+
         The position is based on a fixed vertical spacing defined in conf.py,
         ensuring pins are always on the grid.
         """
-        block_width = self.parent_block.rect().width()
-
         # Calculate Y position based on fixed, grid-aligned spacing.
         # This is independent of the block's final height.
         y = conf.BLOCK_PIN_TOP_PADDING + (self.index * conf.BLOCK_PIN_VERTICAL_SPACING)
-
-        if self.pin_type == PinType.INPUT:
-            x = 0
-            self.setPos(x, y)
-            self.text_item.setPos(conf.BLOCK_PIN_RADIUS + conf.BLOCK_PIN_TEXT_PADDING, -self.text_item.boundingRect().height() / 2)
-        else: # OUTPUT
-            x = block_width
-            self.setPos(x, y)
-            self.text_item.setPos(-conf.BLOCK_PIN_RADIUS - conf.BLOCK_PIN_TEXT_PADDING - self.text_item.boundingRect().width(), -self.text_item.boundingRect().height() / 2)
+        x = 0 if self.pin_type == PinType.INPUT else self.parent_block.rect().width()
+        self._place(x, y)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
         """
@@ -431,7 +771,8 @@ class BlockPin(PinMixin, HoverHighlightMixin, QGraphicsEllipseItem):
                 return # Consume event
 
         # For regular clicks that will initiate a move, disable realignment.
-        if self.parent_block and hasattr(self.parent_block, 'set_pin_realign_enabled'):
+        # The parent is always a Block, so no attribute probing is needed.
+        if self.parent_block:
             self.parent_block.set_pin_realign_enabled(False)
 
         super().mousePressEvent(event)
@@ -444,7 +785,7 @@ class BlockPin(PinMixin, HoverHighlightMixin, QGraphicsEllipseItem):
             event (QGraphicsSceneMouseEvent): The mouse release event.
         """
         super().mouseReleaseEvent(event)
-        if self.parent_block and hasattr(self.parent_block, 'set_pin_realign_enabled'):
+        if self.parent_block:
             self.parent_block.set_pin_realign_enabled(True)
             self.parent_block.realign_pins()
 
@@ -474,6 +815,25 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
         QPointF(0, conf.DIAGRAM_PIN_RADIUS * conf.DIAGRAM_PIN_DIAMOND_SCALE),
         QPointF(-conf.DIAGRAM_PIN_RADIUS * conf.DIAGRAM_PIN_DIAMOND_SCALE, 0)
     ])
+    # The diamond geometry is identical for every DiagramPin and never
+    # changes, so the hit-test shape and bounding rect are built once at
+    # class definition and shared by all instances instead of letting Qt
+    # re-derive them from the polygon on every itemAt/collision query.
+    # The bounding rect is padded for the widest pen the pin is drawn with.
+    _SHAPE = QPainterPath()
+    _SHAPE.addPolygon(DIAMOND_POLYGON)
+    _SHAPE.closeSubpath()
+    _PEN_MARGIN = max(conf.PEN_WIDTH_NORMAL, conf.PEN_WIDTH_HIGHLIGHT) / 2.0
+    _BOUNDING_RECT = DIAMOND_POLYGON.boundingRect().adjusted(-_PEN_MARGIN, -_PEN_MARGIN, _PEN_MARGIN, _PEN_MARGIN)
+
+    def boundingRect(self) -> QRectF:
+        """Returns the precomputed bounding rect shared by all diagram pins."""
+        return DiagramPin._BOUNDING_RECT
+
+    def shape(self) -> QPainterPath:
+        """Returns the precomputed hit-test shape shared by all diagram pins."""
+        return DiagramPin._SHAPE
+
     def __init__(self,
                  name: str,
                  pin_type: PinType,
@@ -504,8 +864,8 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
         self.setAcceptHoverEvents(True)
         self.setZValue(conf.Z_VALUE_PIN)
 
-        self.normal_pen = QPen(conf.BLOCK_BORDER_COLOR, conf.PEN_WIDTH_NORMAL)
-        self.highlight_pen = QPen(conf.BLOCK_HIGHLIGHT_COLOR, conf.PEN_WIDTH_HIGHLIGHT)
+        self.normal_pen = _shared_pen('BLOCK_BORDER_COLOR', conf.PEN_WIDTH_NORMAL)
+        self.highlight_pen = _shared_pen('BLOCK_HIGHLIGHT_COLOR', conf.PEN_WIDTH_HIGHLIGHT)
         self.setPen(self.normal_pen)
 
         self.init_pin(parent_block=None, pin_type=pin_type, name=name)
@@ -525,18 +885,16 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
 
         self.text_item = QGraphicsTextItem(self._name, self)
         self.text_item.setDefaultTextColor(conf.DIAGRAM_PIN_TEXT_COLOR)
-        font = QFont()
-        font.setPointSize(conf.FONT_SIZE_DIAGRAM_PIN)
-        self.text_item.setFont(font)
+        self.text_item.setFont(conf.get_font(conf.FONT_SIZE_DIAGRAM_PIN))
         self.text_item.setZValue(conf.Z_VALUE_TEXT)
+        # Decorative label; exclude it from mouse dispatch.
+        self.text_item.setAcceptedMouseButtons(Qt.NoButton)
         self.update_lock_state()
         self._update_text_position()
 
         if x is not None and y is not None:
             # Snap to grid if coordinates are provided manually
-            snapped_x = round(x / conf.GRID_SIZE) * conf.GRID_SIZE
-            snapped_y = round(y / conf.GRID_SIZE) * conf.GRID_SIZE
-            self.setPos(snapped_x, snapped_y)
+            self.setPos(_snap_to_grid(x), _snap_to_grid(y))
         elif scene_for_auto_placement is not None:
             pin_rect = self.boundingRect()
             item_width = pin_rect.width()
@@ -583,9 +941,14 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
         Args:
             new_name (str): The new name for the pin.
         """
+        old_name = self._name
         self._name = new_name
         self.text_item.setPlainText(self._name)
         self._update_text_position()
+        # Keep the scene's name registry keyed by the current name.
+        scene = self.scene()
+        if scene:
+            scene.notify_item_renamed(self, old_name)
 
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
         """
@@ -594,8 +957,10 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
         Args:
             event (QGraphicsSceneMouseEvent): The mouse press event.
         """
-        if self.scene() and hasattr(self.scene(), 'set_realign_enabled'):
-            self.scene().set_realign_enabled(False)
+        # The scene is always a BlockDiagramScene; guard on presence only.
+        scene = self.scene()
+        if scene:
+            scene.set_realign_enabled(False)
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent) -> None:
@@ -606,10 +971,11 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
             event (QGraphicsSceneMouseEvent): The mouse release event.
         """
         super().mouseReleaseEvent(event)
-        if self.scene() and hasattr(self.scene(), 'set_realign_enabled'):
-            self.scene().set_realign_enabled(True)
+        scene = self.scene()
+        if scene:
+            scene.set_realign_enabled(True)
             # Trigger a final realignment now that the drag is complete.
-            self.scene().realign_diagram_pins()
+            scene.realign_diagram_pins()
 
     def request_rename(self) -> None:
         """
@@ -617,9 +983,9 @@ class DiagramPin(PinMixin, HoverHighlightMixin, SelectableMovableItemMixin, QGra
 
         Emits the `renameDiagramPinRequested` signal on the scene.
         """
-        if self.scene():
-            if hasattr(self.scene(), 'renameDiagramPinRequested'):
-                self.scene().renameDiagramPinRequested.emit(self)
+        scene = self.scene()
+        if scene:
+            scene.renameDiagramPinRequested.emit(self)
 
     def _get_context_menu_texts(self) -> Tuple[str, str]:
         """Abstract method to be implemented by subclasses for context menu text."""
@@ -762,9 +1128,9 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
         super().__init__()
         self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
-        self.normal_pen = QPen(conf.WIRE_COLOR, conf.PEN_WIDTH_NORMAL)
-        self.highlight_pen = QPen(conf.WIRE_HIGHLIGHT_COLOR, conf.PEN_WIDTH_HIGHLIGHT)
-        self.locked_pen = QPen(conf.WIRE_LOCKED_COLOR, conf.PEN_WIDTH_NORMAL)
+        self.normal_pen = _shared_pen('WIRE_COLOR', conf.PEN_WIDTH_NORMAL)
+        self.highlight_pen = _shared_pen('WIRE_HIGHLIGHT_COLOR', conf.PEN_WIDTH_HIGHLIGHT)
+        self.locked_pen = _shared_pen('WIRE_LOCKED_COLOR', conf.PEN_WIDTH_NORMAL)
         self.setPen(self.normal_pen)
         self.setZValue(conf.Z_VALUE_WIRE) # Wires should be below blocks (blocks are Z=2)
 
@@ -772,16 +1138,25 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
         self.start_pin = start_pin
         self.end_pin = end_pin
         self._temp_end_pos = None # For drawing wire during creation drag
-
-        # Use duck-typing to ensure the routing manager has the required method.
-        if not routing_manager or not hasattr(routing_manager, 'calculate_path') or not callable(getattr(routing_manager, 'calculate_path')):
+        self._path_cache_key = None # Inputs of the last computed path; see update_geometry()
+        # Derived-geometry caches, dropped whenever the path changes. Both
+        # length() and the stroked hit shape are expensive to recompute and
+        # are queried far more often than the path moves (hit testing, cost
+        # evaluation).
+        self._length_cache: Optional[float] = None
+        self._shape_cache: Optional[QPainterPath] = None
+
+        # Use duck-typing to ensure the routing manager has the required
+        # method. A single attribute fetch covers the None, missing and
+        # non-callable cases at once.
+        if not callable(getattr(routing_manager, 'calculate_path', None)):
             raise ValueError(conf.UI.Log.ROUTING_MANAGER_INVALID)
         self.routing_manager = routing_manager
 
         if self.start_pin: # start_pin could be None if wire is created improperly (defensive)
-            self.start_pin.wires.append(self)
+            self.start_pin.add_wire(self)
         if self.end_pin:
-            self.end_pin.wires.append(self)
+            self.end_pin.add_wire(self)
 
         self.update_geometry() # Initial draw
 
@@ -790,14 +1165,32 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
         Returns the shape of this item as a QPainterPath for collision detection.
 
         This implementation returns a wider path than the drawn one to make
-        it easier to click on the wire.
+        it easier to click on the wire. The stroked path is cached until the
+        wire is rerouted, since stroking is far more expensive than the
+        lookups that need it (hit tests, intersection scoring).
 
         Returns:
             QPainterPath: The shape of the wire for hit testing.
         """
-        stroker = QPainterPathStroker()
-        stroker.setWidth(conf.WIRE_CLICKABLE_WIDTH)
-        return stroker.createStroke(self.path())
+        if self._shape_cache is None:
+            stroker = QPainterPathStroker()
+            stroker.setWidth(conf.WIRE_CLICKABLE_WIDTH)
+            self._shape_cache = stroker.createStroke(self.path())
+        return self._shape_cache
+
+    def path_length(self) -> float:
+        """
+        Returns the length of the wire's path, cached until rerouting.
+
+        QPainterPath.length() walks the curve numerically on every call, so
+        the cost functions query this wrapper instead.
+
+        Returns:
+            float: The path length in scene units.
+        """
+        if self._length_cache is None:
+            self._length_cache = self.path().length()
+        return self._length_cache
 
     def set_locked(self, locked: bool) -> None:
         """
@@ -814,9 +1207,10 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
                 self.setPen(self.normal_pen)
         self.update()
         # Notify connected pins that their lock state may have changed.
-        if self.start_pin and hasattr(self.start_pin, 'update_lock_state'):
+        # Both ends are always PinMixin instances when present.
+        if self.start_pin:
             self.start_pin.update_lock_state()
-        if self.end_pin and hasattr(self.end_pin, 'update_lock_state'):
+        if self.end_pin:
             self.end_pin.update_lock_state()
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
@@ -843,17 +1237,15 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
             pin (Pin): The new end pin for the wire.
         """
         # Remove from old end_pin's wire list if it exists and is different
-        if self.end_pin and self.end_pin != pin and self in self.end_pin.wires:
-            self.end_pin.wires.remove(self)
-        
+        if self.end_pin and self.end_pin != pin:
+            self.end_pin.remove_wire(self)
+
         self.end_pin = pin
         self._temp_end_pos = None # No longer a temporary wire being dragged
-        
+
         if self.end_pin:
-            if self not in self.end_pin.wires:
-                self.end_pin.wires.append(self)
-            if hasattr(self.end_pin, 'update_lock_state'):
-                self.end_pin.update_lock_state()
+            self.end_pin.add_wire(self)
+            self.end_pin.update_lock_state()
         self.update_geometry()
 
     def update_temp_end_pos(self, scene_pos: QPointF) -> None:
@@ -871,16 +1263,27 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
         """
         Updates the wire's line based on the current positions of its
         start and end pins, using the routing manager.
+
+        The inputs of the last computed path (endpoint positions, pin types
+        and temporary-drag state) are remembered, so redundant calls with
+        unchanged endpoints skip the path recalculation entirely.
         """
         if not self.start_pin or not self.routing_manager:
+            self._path_cache_key = None
+            self._length_cache = None
+            self._shape_cache = None
             self.setPath(QPainterPath()) # Empty path
             return
 
         start_pos = self.start_pin.scenePos()
-        path = QPainterPath() # Default to empty path
+        path = None
 
         if self.end_pin:
             end_pos = self.end_pin.scenePos()
+            key = (start_pos.x(), start_pos.y(), end_pos.x(), end_pos.y(),
+                   self.start_pin.pin_type, self.end_pin.pin_type, False)
+            if key == self._path_cache_key:
+                return
             path = self.routing_manager.calculate_path(
                 start_pos,
                 end_pos,
@@ -890,6 +1293,11 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
                 wire_being_routed=self
             )
         elif self._temp_end_pos:
+            end_pos = self._temp_end_pos
+            key = (start_pos.x(), start_pos.y(), end_pos.x(), end_pos.y(),
+                   self.start_pin.pin_type, None, True)
+            if key == self._path_cache_key:
+                return
             path = self.routing_manager.calculate_path(
                 start_pos,
                 self._temp_end_pos,
@@ -898,9 +1306,40 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
                 is_temporary=True,
                 wire_being_routed=self
             )
-        # path will be empty if no end_pin or temp_end_pos, or if routing_manager returns empty.
+        else:
+            # No end point yet: fall back to an empty path.
+            key = None
+            path = QPainterPath()
+
+        self._path_cache_key = key
+        self._length_cache = None
+        self._shape_cache = None
         self.setPath(path) # Set the calculated path
 
+    # Lazily built, class-shared context menu; see _get_context_menu.
+    _context_menu: Optional[QMenu] = None
+    _context_menu_actions: Optional[Tuple] = None
+
+    @classmethod
+    def _get_context_menu(cls) -> Tuple[QMenu, Tuple]:
+        """
+        Returns the shared context menu for wires, building it on first use.
+
+        The menu layout is static; callers refresh the state-dependent
+        lock action text before showing it.
+
+        Returns:
+            Tuple[QMenu, Tuple]: The menu and its (lock, delete) actions.
+        """
+        if cls._context_menu is None:
+            menu = QMenu()
+            lock_action = menu.addAction("")
+            menu.addSeparator()
+            delete_action = menu.addAction(conf.UI.Menu.DELETE_WIRE)
+            cls._context_menu = menu
+            cls._context_menu_actions = (lock_action, delete_action)
+        return cls._context_menu, cls._context_menu_actions
+
     @single_selection_only
     def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent) -> None:
         """
@@ -909,14 +1348,10 @@ class Wire(SelectableMovableItemMixin, QGraphicsPathItem):
         Args:
             event (QGraphicsSceneContextMenuEvent): The context menu event.
         """
-        menu = QMenu()
-
-        # Add Lock/Unlock action
-        lock_text = conf.UI.Menu.UNLOCK_WIRE if self.is_locked else conf.UI.Menu.LOCK_WIRE
-        lock_action = menu.addAction(lock_text)
-        menu.addSeparator()
-
-        delete_action = menu.addAction(conf.UI.Menu.DELETE_WIRE)
+        # The menu structure is identical for every wire, so it is built
+        # once per class; only the lock action's text depends on state.
+        menu, (lock_action, delete_action) = self._get_context_menu()
+        lock_action.setText(conf.UI.Menu.UNLOCK_WIRE if self.is_locked else conf.UI.Menu.LOCK_WIRE)
 
         # The scene() method gives us access to the BlockDiagramScene instance
         # which has the logic to properly remove wires.
@@ -967,6 +1402,11 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         log_func (callable): A function for logging messages.
         title_item (QGraphicsTextItem): The text item for the block's title.
     """
+    # Cached union of the block rect and its external title, invalidated by
+    # set_size. A class-level default keeps boundingRect safe if Qt queries
+    # it during base-class construction.
+    _cached_bounding_rect: Optional[QRectF] = None
+
     def __init__(self,
                  name: str = 'Block',
                  x: Optional[float] = None,
@@ -999,9 +1439,9 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         self._pin_realign_enabled = True
 
         self.setBrush(QBrush(conf.BLOCK_COLOR))
-        self.normal_pen = QPen(conf.BLOCK_BORDER_COLOR, conf.PEN_WIDTH_NORMAL)
-        self.highlight_pen = QPen(conf.BLOCK_HIGHLIGHT_COLOR, conf.PEN_WIDTH_HIGHLIGHT)
-        self.locked_pen = QPen(conf.BLOCK_LOCKED_BORDER_COLOR, conf.PEN_WIDTH_NORMAL)
+        self.normal_pen = _shared_pen('BLOCK_BORDER_COLOR', conf.PEN_WIDTH_NORMAL)
+        self.highlight_pen = _shared_pen('BLOCK_HIGHLIGHT_COLOR', conf.PEN_WIDTH_HIGHLIGHT)
+        self.locked_pen = _shared_pen('BLOCK_LOCKED_BORDER_COLOR', conf.PEN_WIDTH_NORMAL)
         self.setPen(self.normal_pen)
 
         self._name = name
@@ -1012,20 +1452,20 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
 
         # Use a dark color for the title, as it's now outside the block.
         self.title_item.setDefaultTextColor(conf.DIAGRAM_PIN_TEXT_COLOR)
-        font = QFont()
-        font.setPointSize(conf.FONT_SIZE_BLOCK_TITLE)
-        font.setWeight(conf.FONT_WEIGHT_BLOCK_TITLE)
-        self.title_item.setFont(font)
+        self.title_item.setFont(conf.get_font(conf.FONT_SIZE_BLOCK_TITLE, conf.FONT_WEIGHT_BLOCK_TITLE))
         self.title_item.setZValue(conf.Z_VALUE_TEXT)
+        # Decorative label; exclude it from mouse dispatch.
+        self.title_item.setAcceptedMouseButtons(Qt.NoButton)
+        # Titles change only on rename; cache the rendered glyphs so
+        # repaints blit a pixmap instead of re-running text layout.
+        self.title_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
         # Calculate initial dimensions based on title and (empty) pin lists
         auto_width, auto_height = self._get_auto_dimensions()
         self.set_size(auto_width, auto_height) # Set size first, this will also position the title
         
         if x is not None and y is not None:
-            snapped_x = round(x / conf.GRID_SIZE) * conf.GRID_SIZE
-            snapped_y = round(y / conf.GRID_SIZE) * conf.GRID_SIZE
-            self.setPos(snapped_x, snapped_y)
+            self.setPos(_snap_to_grid(x), _snap_to_grid(y))
         elif scene_for_auto_placement is not None:
             item_width = self.rect().width()
             item_height = self.rect().height()
@@ -1044,12 +1484,22 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
 
     def boundingRect(self) -> QRectF:
         """Returns the bounding rectangle of the block, including its external title."""
+        # Qt queries boundingRect constantly (hit testing, index updates,
+        # repaints); the union with the title only changes when the block is
+        # resized or renamed, both of which funnel through set_size, so the
+        # result is cached until then.
+        cached = self._cached_bounding_rect
+        if cached is not None:
+            return cached
+
         base_rect = self.rect()
         # The title's bounding rect is in its own coordinate system.
         # We need to map it to the block's coordinate system by using its position.
         title_rect_in_block_coords = QRectF(self.title_item.pos(), self.title_item.boundingRect().size())
         # The final bounding box is the union of the block's rectangle and its title.
-        return base_rect.united(title_rect_in_block_coords)
+        result = base_rect.united(title_rect_in_block_coords)
+        self._cached_bounding_rect = result
+        return result
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
         """
@@ -1078,10 +1528,15 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         # First, call the superclass implementation to get snapping and wire updates.
         result = super().itemChange(change, value)
 
-        # After the position has changed, the super block is dirty.
+        # After the position has changed, the super block is dirty. Defer
+        # the realign to the event loop so a drag that moves several
+        # selected blocks triggers one realign per input event, not one
+        # per block.
         if change == QGraphicsItem.ItemPositionHasChanged:
-            if self.scene() and hasattr(self.scene(), 'realign_diagram_pins'):
-                self.scene().realign_diagram_pins()
+            scene = self.scene()
+            if scene:
+                scene.invalidate_blocks_bbox()
+                scene.schedule_diagram_pin_realign()
         return result
 
     def _update_title_position(self) -> None:
@@ -1111,14 +1566,11 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         """Calculates the maximum horizontal space required by a set of pin labels."""
         if not pins:
             return 0
-        
-        max_span = 0
-        for pin in pins.values():
-            # Span = pin circle radius + padding to text + text width + internal block padding
-            span = conf.BLOCK_PIN_RADIUS + conf.BLOCK_PIN_TEXT_PADDING + pin.text_item.boundingRect().width() + conf.MIN_BLOCK_INTERNAL_PADDING
-            if span > max_span:
-                max_span = span
-        return float(max_span)
+
+        # Each pin caches its label span at creation (labels never change),
+        # so this reduces to a max over precomputed floats instead of a
+        # text bounding-rect query per pin on every auto-size pass.
+        return float(max(pin._label_span for pin in pins.values()))
     def _calculate_auto_width(self) -> float:
         """Calculates the optimal width for the block."""
         title_rect = self.title_item.boundingRect()
@@ -1151,10 +1603,19 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
             width (float): The desired width of the block.
             height (float): The desired height of the block.
         """
-        snapped_width = max(conf.MIN_ITEM_DIMENSION, math.ceil(width / conf.GRID_SIZE) * conf.GRID_SIZE) # Snap up to nearest grid multiple
-        snapped_height = max(conf.MIN_ITEM_DIMENSION, math.ceil(height / conf.GRID_SIZE) * conf.GRID_SIZE) # Snap up to nearest grid multiple
-        
+        snapped_width = max(conf.MIN_ITEM_DIMENSION, _snap_up_to_grid(width)) # Snap up to nearest grid multiple
+        snapped_height = max(conf.MIN_ITEM_DIMENSION, _snap_up_to_grid(height)) # Snap up to nearest grid multiple
+
+        # The cached bounding rect (block rect united with the title) is
+        # about to change; tell the scene before it does.
+        self.prepareGeometryChange()
+        self._cached_bounding_rect = None
         self.setRect(0, 0, snapped_width, snapped_height)
+        scene = self.scene()
+        if scene:
+            # A resize shifts this block's scene rect, so the scene's
+            # memoised blocks bounding box is stale.
+            scene.invalidate_blocks_bbox()
         self.update_pin_positions()
         self._update_title_position()
     def add_input_pin(self, name: str) -> Optional['BlockPin']:
@@ -1261,39 +1722,107 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         Args:
             new_name (str): The new name for the block.
         """
+        old_name = self._name
         self._name = new_name
         self.title_item.setPlainText(self._name)
         self.auto_adjust_size() # Adjust size in case the new name is longer/shorter
+        # Keep the scene's name registry keyed by the current name.
+        scene = self.scene()
+        if scene:
+            scene.notify_item_renamed(self, old_name)
     def update_pin_positions(self) -> None:
         """
         Recalculates and updates the positions of all pins on the block.
         This is called after adding/removing pins or resizing the block.
-        """
-        for pin in list(self.input_pins.values()) + list(self.output_pins.values()):
-            pin.update_position()
-        self.update_connected_wires()
-    def update_connected_wires(self) -> None:
-        """Updates the geometry of all wires connected to this block's pins."""
-        for pin in list(self.input_pins.values()) + list(self.output_pins.values()):
-            for wire in pin.wires:
+
+        The block width and spacing constants are read once and the
+        per-pin coordinates are handed to each pin directly, instead of
+        every pin re-deriving them from the parent.
+        """
+        width = self.rect().width()
+        top_padding = conf.BLOCK_PIN_TOP_PADDING
+        spacing = conf.BLOCK_PIN_VERTICAL_SPACING
+        # Placement and wire collection are fused into one pass: each pin is
+        # visited exactly once, gathering its wires for a deduplicated
+        # reroute instead of walking all pins a second time.
+        touched = set()
+        for pins, x in ((self.input_pins, 0), (self.output_pins, width)):
+            for pin in pins.values():
+                pin._place(x, top_padding + pin.index * spacing)
+                touched.update(pin._wires_tuple)
+
+        pending = getattr(self.scene(), '_pending_wire_updates', None)
+        if pending is not None:
+            pending.update(touched)
+        else:
+            for wire in touched:
                 wire.update_geometry()
+    def update_connected_wires(self) -> None:
+        """
+        Updates the geometry of all wires connected to this block's pins.
+
+        While the scene is batching (during a drag mouse-move), the wires
+        are only queued and recomputed once by the scene afterwards. A wire
+        connecting two pins of this same block appears in both pins' lists;
+        it is rerouted only once per pass either way.
+        """
+        scene = self.scene()
+        pending = getattr(scene, '_pending_wire_updates', None)
+        seen = set()
+        for pin in itertools.chain(self.input_pins.values(), self.output_pins.values()):
+            if pending is not None:
+                pending.update(pin._wires_tuple)
+                continue
+            for wire in pin._wires_tuple:
+                if wire not in seen:
+                    seen.add(wire)
+                    wire.update_geometry()
     def request_rename(self) -> None:
         """
         Handles the logic for when a rename is requested from the context menu.
 
         Emits the `renameBlockRequested` signal on the scene.
         """
-        if self.scene():
-            if hasattr(self.scene(), 'renameBlockRequested'):
-                self.scene().renameBlockRequested.emit(self)
+        scene = self.scene()
+        if scene:
+            scene.renameBlockRequested.emit(self)
     def request_add_pin(self) -> None:
         """
         Handles the logic for when adding a pin is requested from the context menu.
 
         Emits the `addPinToBlockRequested` signal on the scene.
         """
-        if self.scene() and hasattr(self.scene(), 'addPinToBlockRequested'):
-            self.scene().addPinToBlockRequested.emit()
+        scene = self.scene()
+        if scene:
+            scene.addPinToBlockRequested.emit()
+    # Lazily built, class-shared context menu; see _get_context_menu.
+    _context_menu: Optional[QMenu] = None
+    _context_menu_actions: Optional[Tuple] = None
+
+    @classmethod
+    def _get_context_menu(cls) -> Tuple[QMenu, Tuple]:
+        """
+        Returns the shared context menu for blocks, building it on first use.
+
+        The menu layout is static; callers refresh the state-dependent
+        lock action text before showing it.
+
+        Returns:
+            Tuple[QMenu, Tuple]: The menu and its (rename, add pin, lock,
+            delete) actions.
+        """
+        if cls._context_menu is None:
+            menu = QMenu()
+            rename_action = menu.addAction(conf.UI.Menu.RENAME_BLOCK)
+            add_pin_action = menu.addAction(conf.UI.Menu.ADD_BLOCK_PIN)
+            menu.addSeparator()
+            lock_action = menu.addAction("")
+            menu.addSeparator()
+            delete_action = menu.addAction(conf.UI.Menu.DELETE_BLOCK)
+            cls._context_menu = menu
+            cls._context_menu_actions = (rename_action, add_pin_action, lock_action, delete_action)
+        return cls._context_menu, cls._context_menu_actions
+
     @single_selection_only
     def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent) -> None:
         """
@@ -1302,19 +1831,11 @@ class Block(SelectableMovableItemMixin, QGraphicsRectItem):
         Args:
             event (QGraphicsSceneContextMenuEvent): The context menu event.
         """
-        menu = QMenu()
-        rename_action = menu.addAction(conf.UI.Menu.RENAME_BLOCK)
-        add_pin_action = menu.addAction(conf.UI.Menu.ADD_BLOCK_PIN)
-
-        menu.addSeparator()
+        # The menu structure is identical for every block, so it is built
+        # once per class; only the lock action's text depends on state.
+        menu, (rename_action, add_pin_action, lock_action, delete_action) = self._get_context_menu()
+        lock_action.setText(conf.UI.Menu.UNLOCK_BLOCK_POSITION if self.is_locked else conf.UI.Menu.LOCK_BLOCK_POSITION)
 
-        # Add Lock/Unlock action
-        lock_text = conf.UI.Menu.UNLOCK_BLOCK_POSITION if self.is_locked else conf.UI.Menu.LOCK_BLOCK_POSITION
-        lock_action = menu.addAction(lock_text)
-
-        menu.addSeparator()
-        delete_action = menu.addAction(conf.UI.Menu.DELETE_BLOCK)
-        
         action = menu.exec_(event.screenPos())
 
         if action == lock_action:
@@ -1366,38 +1887,37 @@ class RoutingManager:
 
         # Calculate horizontal distance to determine the curve's "strength"
         dx = end_pos.x() - start_pos.x()
-        
+
+        # Endpoints closer than a stub length in both axes produce a curve
+        # that is visually indistinguishable from a straight segment, so
+        # skip the control-point math for those.
+        if abs(dx) < conf.WIRE_STUB_LENGTH and abs(end_pos.y() - start_pos.y()) < conf.WIRE_STUB_LENGTH:
+            path.lineTo(end_pos)
+            return path
+
         # The horizontal offset for the control points. A larger offset creates a wider, more gentle curve.
         # We use a base offset and add a factor of the horizontal distance.
-        offset = max(abs(dx) * conf.BEZIER_DX_FACTOR, conf.WIRE_STUB_LENGTH * conf.BEZIER_STUB_FACTOR)
-
-        # Control point 1, extending from the start pin
-        cp1_x = start_pos.x()
-        if start_pin_type == PinType.OUTPUT:
-            cp1_x += offset
-        else:  # TYPE_INPUT
-            cp1_x -= offset
-        cp1 = QPointF(cp1_x, start_pos.y())
-
-        # Control point 2, extending from the end pin
-        cp2_x = end_pos.x()
-        
+        offset = max(abs(dx) * conf.BEZIER_DX_FACTOR, conf.BEZIER_MIN_OFFSET)
+
+        # Control point 1, extending from the start pin. The per-type branch
+        # chains are replaced by a sign lookup: control points extend away
+        # from outputs (+) and towards inputs (-).
+        cp1_x = start_pos.x() + _PIN_SIGN[start_pin_type] * offset
+
         # For temporary wires, the end pin type is unknown. We infer a logical target.
         effective_end_pin_type = end_pin_type
         if is_temporary:
             # If dragging from an output, assume the target is an input, and vice-versa.
             effective_end_pin_type = PinType.INPUT if start_pin_type == PinType.OUTPUT else PinType.OUTPUT
 
-        if effective_end_pin_type == PinType.INPUT:
-            cp2_x -= offset
-        elif effective_end_pin_type == PinType.OUTPUT: # Can happen if connecting input -> output
-            cp2_x += offset
-        else: # Fallback for non-temporary wires with no valid end_pin_type
-             cp2_x -= offset
-
-        cp2 = QPointF(cp2_x, end_pos.y())
+        # Control point 2, extending from the end pin. The None key covers
+        # non-temporary wires with no valid end_pin_type, which fall back to
+        # the input-side direction.
+        cp2_x = end_pos.x() + _PIN_SIGN[effective_end_pin_type] * offset
 
-        path.cubicTo(cp1, cp2, end_pos)
+        # Use the scalar cubicTo overload: the control points exist only for
+        # this call, so there is no reason to wrap them in QPointF first.
+        path.cubicTo(cp1_x, start_pos.y(), cp2_x, end_pos.y(), end_pos.x(), end_pos.y())
         return path
 
 class BlockDiagramScene(QGraphicsScene):
@@ -1436,14 +1956,165 @@ class BlockDiagramScene(QGraphicsScene):
         super().__init__(parent)
         self.setBackgroundBrush(QBrush(Qt.white))
         self.routing_manager = RoutingManager(scene=self)
-        self.setSceneRect(conf.SCENE_RECT_X, conf.SCENE_RECT_Y, conf.SCENE_RECT_WIDTH, conf.SCENE_RECT_HEIGHT)
+        self.setSceneRect(*conf.SCENE_RECT)
 
         self.temp_wire: Optional[Wire] = None
         self.start_pin_for_wire: Optional[Pin] = None
         self.hovered_pin: Optional[Pin] = None
+        # The view registered via set_primary_view; mouse handlers read its
+        # transform directly instead of rebuilding views()[0] per event.
+        self._primary_view: Optional[QGraphicsView] = None
         self.log_func: Callable[[str], None] = print # Default logger
         self._realign_enabled = True
         self.optimizer_available = False
+        # Placement obstacles (Blocks and DiagramPins) are tracked in a set
+        # maintained by addItem/removeItem, so collision queries can test
+        # membership instead of isinstance-dispatching over every item.
+        self._placement_obstacles: set = set()
+        # Per-type registries, also maintained by addItem/removeItem, so the
+        # realignment and bounding-box passes iterate just the items they
+        # care about instead of isinstance-filtering the whole scene. The
+        # named types are keyed by name (unique per type), which makes
+        # name lookups a single dict probe; wires have no name and are
+        # kept in a set.
+        self._blocks: Dict[str, 'Block'] = {}
+        self._wires: set = set()
+        self._diagram_input_pins: Dict[str, 'DiagramInputPin'] = {}
+        self._diagram_output_pins: Dict[str, 'DiagramOutputPin'] = {}
+        # Memoised blocks bounding box, dropped whenever a block is added,
+        # removed, moved or resized; see get_blocks_bounding_box.
+        self._blocks_bbox_cache: Optional[QRectF] = None
+        # When not None, wire geometry updates are being batched for the
+        # current mouse-move event; see mouseMoveEvent.
+        self._pending_wire_updates: Optional[set] = None
+        # Zero-interval single-shot timer used to coalesce realign requests
+        # from interactive paths; see schedule_diagram_pin_realign.
+        self._realign_timer = QTimer(self)
+        self._realign_timer.setSingleShot(True)
+        self._realign_timer.setInterval(0)
+        self._realign_timer.timeout.connect(self.realign_diagram_pins)
+        # Last computed grid geometry, keyed by the exposed rect it was
+        # built for; see drawBackground.
+        self._grid_cache: Tuple[Optional[Tuple[float, float, float, float]], QPainterPath] = (None, QPainterPath())
+        # Lazily built context menu for right-clicks on empty canvas; see
+        # _get_scene_context_menu.
+        self._scene_menu: Optional[QMenu] = None
+        self._scene_menu_actions: Optional[Tuple] = None
+
+    def addItem(self, item: QGraphicsItem) -> None:
+        """
+        Adds an item to the scene, registering it as a placement obstacle
+        if it is a Block or DiagramPin.
+
+        Args:
+            item (QGraphicsItem): The item to add.
+        """
+        super().addItem(item)
+        if isinstance(item, Block):
+            self._placement_obstacles.add(item)
+            self._blocks[item.name] = item
+            self._blocks_bbox_cache = None
+        elif isinstance(item, Wire):
+            self._wires.add(item)
+        elif isinstance(item, DiagramPin):
+            self._placement_obstacles.add(item)
+            if isinstance(item, DiagramInputPin):
+                self._diagram_input_pins[item.name] = item
+            elif isinstance(item, DiagramOutputPin):
+                self._diagram_output_pins[item.name] = item
+
+    def removeItem(self, item: QGraphicsItem) -> None:
+        """
+        Removes an item from the scene and from the placement obstacle set.
+
+        Args:
+            item (QGraphicsItem): The item to remove.
+        """
+        super().removeItem(item)
+        self._placement_obstacles.discard(item)
+        if isinstance(item, Block):
+            if self._blocks.get(item.name) is item:
+                del self._blocks[item.name]
+            self._blocks_bbox_cache = None
+        elif isinstance(item, Wire):
+            self._wires.discard(item)
+        elif isinstance(item, DiagramInputPin):
+            if self._diagram_input_pins.get(item.name) is item:
+                del self._diagram_input_pins[item.name]
+        elif isinstance(item, DiagramOutputPin):
+            if self._diagram_output_pins.get(item.name) is item:
+                del self._diagram_output_pins[item.name]
+
+    def notify_item_renamed(self, item: QGraphicsItem, old_name: str) -> None:
+        """
+        Re-keys the name registries after an item rename.
+
+        Called by the name setters of the registered item types, so the
+        registries stay consistent with the names shown on the canvas.
+
+        Args:
+            item (QGraphicsItem): The item that was renamed.
+            old_name (str): The name it was registered under.
+        """
+        for registry in (self._blocks, self._diagram_input_pins, self._diagram_output_pins):
+            if registry.get(old_name) is item:
+                del registry[old_name]
+                registry[item.name] = item
+                return
+
+    def named_item(self, item_class_or_tuple: Union[type, Tuple[type, ...]], name: str) -> Optional[QGraphicsItem]:
+        """
+        Looks up a registered item of the given class(es) by name.
+
+        Names are unique per registered type, so this is a dict probe per
+        matching registry rather than a scene scan.
+
+        Args:
+            item_class_or_tuple (Union[type, Tuple[type, ...]]): The class,
+                or tuple of classes, to search. Must be one of the named
+                registered types (Block, DiagramInputPin, DiagramOutputPin)
+                or a base class of them (e.g. DiagramPin).
+            name (str): The name to look up.
+
+        Returns:
+            Optional[QGraphicsItem]: The matching item, or None.
+        """
+        for registry_class, registry in ((Block, self._blocks),
+                                         (DiagramInputPin, self._diagram_input_pins),
+                                         (DiagramOutputPin, self._diagram_output_pins)):
+            if issubclass(registry_class, item_class_or_tuple):
+                item = registry.get(name)
+                if item is not None:
+                    return item
+        return None
+
+    def registered_items(self, item_class_or_tuple: Union[type, Tuple[type, ...]]) -> List[QGraphicsItem]:
+        """
+        Returns the registered top-level items of the given class(es).
+
+        The per-type registries maintained by addItem/removeItem are matched
+        by class, so this avoids isinstance-filtering the full item list
+        (which also contains pins, labels and other child items).
+
+        Args:
+            item_class_or_tuple (Union[type, Tuple[type, ...]]): The class,
+                or tuple of classes, to collect. Must be one of the
+                registered types (Block, Wire, DiagramInputPin,
+                DiagramOutputPin) or a base class of them (e.g. DiagramPin).
+
+        Returns:
+            List[QGraphicsItem]: The matching registered items.
+        """
+        matched: List[QGraphicsItem] = []
+        if issubclass(Block, item_class_or_tuple):
+            matched.extend(self._blocks.values())
+        if issubclass(Wire, item_class_or_tuple):
+            matched.extend(self._wires)
+        if issubclass(DiagramInputPin, item_class_or_tuple):
+            matched.extend(self._diagram_input_pins.values())
+        if issubclass(DiagramOutputPin, item_class_or_tuple):
+            matched.extend(self._diagram_output_pins.values())
+        return matched
 
     def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
         """
@@ -1455,18 +2126,62 @@ class BlockDiagramScene(QGraphicsScene):
         """
         super().drawBackground(painter, rect)
 
-        left = int(rect.left()) - (int(rect.left()) % conf.GRID_SIZE)
-        top = int(rect.top()) - (int(rect.top()) % conf.GRID_SIZE)
+        # Repaints very often re-expose the same region (item-only updates,
+        # hover highlights, selection changes), and the grid geometry depends
+        # only on the exposed rect; reuse the previous path when it matches.
+        # A single QPainterPath streams all lines in one draw call instead of
+        # per-line dispatch through drawLines.
+        key = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        cached_key, path = self._grid_cache
+        if key != cached_key:
+            left = int(rect.left()) - (int(rect.left()) % conf.GRID_SIZE)
+            top = int(rect.top()) - (int(rect.top()) % conf.GRID_SIZE)
 
-        lines = []
-        for x in range(left, int(rect.right()), conf.GRID_SIZE):
-            lines.append(QLineF(x, rect.top(), x, rect.bottom()))
-        for y in range(top, int(rect.bottom()), conf.GRID_SIZE):
-            lines.append(QLineF(rect.left(), y, rect.right(), y))
+            path = QPainterPath()
+            rect_top, rect_bottom = rect.top(), rect.bottom()
+            for x in range(left, int(rect.right()), conf.GRID_SIZE):
+                path.moveTo(x, rect_top)
+                path.lineTo(x, rect_bottom)
+            rect_left, rect_right = rect.left(), rect.right()
+            for y in range(top, int(rect.bottom()), conf.GRID_SIZE):
+                path.moveTo(rect_left, y)
+                path.lineTo(rect_right, y)
+            self._grid_cache = (key, path)
 
-        pen = QPen(conf.GRID_COLOR_LIGHT, conf.PEN_WIDTH_GRID)
-        painter.setPen(pen)
-        painter.drawLines(lines)
+        # Grid lines are strictly axis-aligned; antialiasing only adds
+        # destination-pixel blending cost without changing their look.
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(QPen(conf.GRID_COLOR_LIGHT, conf.PEN_WIDTH_GRID))
+        painter.drawPath(path)
+        painter.restore()
+
+    def set_primary_view(self, view: QGraphicsView) -> None:
+        """
+        Registers the view whose transform mouse handlers should use.
+
+        Args:
+            view (QGraphicsView): The view displaying this scene.
+        """
+        self._primary_view = view
+
+    def _view_transform(self) -> QTransform:
+        """
+        Returns the primary view's transform for itemAt queries.
+
+        Falls back to the views() list (or an identity transform for a
+        viewless scene) if no primary view has been registered.
+
+        Returns:
+            QTransform: The transform to pass to itemAt.
+        """
+        view = self._primary_view
+        if view is None:
+            views = self.views()
+            if not views:
+                return QTransform()
+            view = views[0]
+        return view.transform()
 
     def set_realign_enabled(self, enabled: bool) -> None:
         """
@@ -1484,6 +2199,27 @@ class BlockDiagramScene(QGraphicsScene):
         # Use the pin's own highlight color attribute
         self.start_pin_for_wire.setBrush(QBrush(self.start_pin_for_wire.highlight_color))
 
+    def _pin_at(self, scene_pos: QPointF) -> Optional[Pin]:
+        """
+        Returns the topmost pin at the given scene position, if any.
+
+        itemAt only reports the single topmost item, which during a wire
+        drag is often the temporary wire or a text label sitting over the
+        pin the user is aiming at. Walking the stacking-order list and
+        stopping at the first pin finds covered pins and avoids the
+        discard-and-miss that itemAt forces.
+
+        Args:
+            scene_pos (QPointF): The position to query, in scene coordinates.
+
+        Returns:
+            Pin or None: The topmost pin at that position, or None.
+        """
+        for item in self.items(scene_pos, Qt.IntersectsItemShape, Qt.DescendingOrder, self._view_transform()):
+            if isinstance(item, (BlockPin, DiagramPin)):
+                return item
+        return None
+
     def _get_valid_target_pin(self, item_under_mouse: QGraphicsItem) -> Optional[Pin]:
         """
         Checks if the item under the mouse is a valid target for the current wire drag.
@@ -1523,7 +2259,7 @@ class BlockDiagramScene(QGraphicsScene):
         Args:
             event (QGraphicsSceneMouseEvent): The mouse press event.
         """
-        item = self.itemAt(event.scenePos(), self.views()[0].transform())
+        item = self.itemAt(event.scenePos(), self._view_transform())
 
         # A Ctrl+left-click on a DiagramPin starts a wire.
         # BlockPin handles its own wire drag initiation via its mousePressEvent.
@@ -1536,6 +2272,37 @@ class BlockDiagramScene(QGraphicsScene):
             # movement, or BlockPin starting a wire).
             super().mousePressEvent(event)
 
+    def _get_scene_context_menu(self) -> Tuple[QMenu, Tuple]:
+        """
+        Returns the empty-canvas context menu, building it on first use.
+
+        The layout is static; the caller toggles the optimize action's
+        visibility to match optimizer availability before showing it.
+
+        Returns:
+            Tuple[QMenu, Tuple]: The menu and its (add block, add input,
+            add output, fit view, optimize, export SVG, unlock all) actions.
+        """
+        if self._scene_menu is None:
+            menu = QMenu()
+            add_block_action = menu.addAction(conf.UI.Menu.ADD_BLOCK)
+            menu.addSeparator()
+            add_sys_input_action = menu.addAction(conf.UI.Menu.ADD_DIAGRAM_INPUT)
+            add_sys_output_action = menu.addAction(conf.UI.Menu.ADD_DIAGRAM_OUTPUT)
+            menu.addSeparator()
+            fit_view_action = menu.addAction(conf.UI.Menu.FIT_TO_VIEW)
+            menu.addSeparator()
+            optimize_placement_action = menu.addAction(conf.UI.Menu.OPTIMIZE_PLACEMENT)
+            menu.addSeparator()
+            export_svg_action = menu.addAction(conf.UI.Menu.EXPORT_TO_SVG)
+            unlock_all_action = menu.addAction(conf.UI.Menu.UNLOCK_EVERYTHING)
+            self._scene_menu = menu
+            self._scene_menu_actions = (add_block_action, add_sys_input_action,
+                                        add_sys_output_action, fit_view_action,
+                                        optimize_placement_action,
+                                        export_svg_action, unlock_all_action)
+        return self._scene_menu, self._scene_menu_actions
+
     def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent) -> None:
         """
         Shows a context menu for adding items when right-clicking on empty space.
@@ -1545,30 +2312,20 @@ class BlockDiagramScene(QGraphicsScene):
         """
         # Check if the right-click was on an item. If so, let the item handle it.
         # This is important because Wire and Block also have contextMenuEvent.
-        item = self.itemAt(event.scenePos(), self.views()[0].transform())
+        item = self.itemAt(event.scenePos(), self._view_transform())
         if item:
             super().contextMenuEvent(event) # Let the item's context menu handle it
             return
 
         # If no item was clicked, show the scene's context menu
         if event.reason() == QGraphicsSceneContextMenuEvent.Mouse: # Ensure it's a mouse right-click
-            menu = QMenu()
-            add_block_action = menu.addAction(conf.UI.Menu.ADD_BLOCK)
-            menu.addSeparator()
-            add_sys_input_action = menu.addAction(conf.UI.Menu.ADD_DIAGRAM_INPUT)
-            add_sys_output_action = menu.addAction(conf.UI.Menu.ADD_DIAGRAM_OUTPUT)
-            menu.addSeparator()
-            fit_view_action = menu.addAction(conf.UI.Menu.FIT_TO_VIEW)
-
-            optimize_placement_action = None
-            if self.optimizer_available:
-                menu.addSeparator()
-                optimize_placement_action = menu.addAction(conf.UI.Menu.OPTIMIZE_PLACEMENT)
-
-            menu.addSeparator()
-            export_svg_action = menu.addAction(conf.UI.Menu.EXPORT_TO_SVG)
-
-            unlock_all_action = menu.addAction(conf.UI.Menu.UNLOCK_EVERYTHING)
+            # The menu is built once and reused; only the optimize action's
+            # visibility depends on state. QMenu collapses the adjacent
+            # separator automatically while it is hidden.
+            menu, (add_block_action, add_sys_input_action, add_sys_output_action,
+                   fit_view_action, optimize_placement_action,
+                   export_svg_action, unlock_all_action) = self._get_scene_context_menu()
+            optimize_placement_action.setVisible(self.optimizer_available)
 
             action = menu.exec_(event.screenPos())
 
@@ -1582,7 +2339,7 @@ class BlockDiagramScene(QGraphicsScene):
                 self.addDiagramOutputRequested.emit()
             elif action == fit_view_action:
                 self.fitInViewRequested.emit()
-            elif action == optimize_placement_action: # Safe, as action is None if item not created
+            elif action == optimize_placement_action: # Unselectable while hidden
                 self.optimizePlacementRequested.emit()
             elif action == export_svg_action:
                 self.exportSvgRequested.emit()
@@ -1602,8 +2359,7 @@ class BlockDiagramScene(QGraphicsScene):
         if self.temp_wire:
             self.temp_wire.update_temp_end_pos(event.scenePos())
             
-            item_under_mouse = self.itemAt(event.scenePos(), self.views()[0].transform())
-            new_hovered_pin = self._get_valid_target_pin(item_under_mouse)
+            new_hovered_pin = self._get_valid_target_pin(self._pin_at(event.scenePos()))
 
             # If we moved off a previously hovered pin, reset its color
             if self.hovered_pin and self.hovered_pin != new_hovered_pin:
@@ -1618,7 +2374,18 @@ class BlockDiagramScene(QGraphicsScene):
             self.hovered_pin = new_hovered_pin
             # End of highlighting logic
 
-        super().mouseMoveEvent(event)
+        # Batch the wire geometry updates triggered by item moves during
+        # this event. Dragging several selected blocks fires itemChange per
+        # item, and a wire whose endpoints both moved would otherwise be
+        # rerouted once per endpoint; the set recomputes each affected wire
+        # exactly once after all items have settled.
+        self._pending_wire_updates = set()
+        try:
+            super().mouseMoveEvent(event)
+        finally:
+            pending, self._pending_wire_updates = self._pending_wire_updates, None
+            for wire in pending:
+                wire.update_geometry()
 
     def _finalize_wire_connection(self, start_pin: Pin, end_pin: Pin) -> None:
         """
@@ -1642,8 +2409,8 @@ class BlockDiagramScene(QGraphicsScene):
         """Resets all visual and state variables after a wire drag operation."""
         # Remove the temporary wire from the scene and the start pin's list
         if self.temp_wire:
-            if self.start_pin_for_wire and self.temp_wire in self.start_pin_for_wire.wires:
-                self.start_pin_for_wire.wires.remove(self.temp_wire)
+            if self.start_pin_for_wire:
+                self.start_pin_for_wire.remove_wire(self.temp_wire)
             self.removeItem(self.temp_wire)
 
         # Reset the color of the pin where the drag started
@@ -1713,15 +2480,26 @@ class BlockDiagramScene(QGraphicsScene):
                     for wire in pin.wires:
                         wires_to_remove.add(wire)
 
-        # Now, remove the items in the correct order: wires first, then nodes.
-        for wire in wires_to_remove:
-            self.remove_wire(wire)
-        
-        for node in nodes_to_remove:
-            self.removeItem(node)
+        # Suppress viewport repaints while the batch is removed: each
+        # removeItem otherwise invalidates its region individually, and a
+        # large multi-select delete repaints once per item. Re-enabling
+        # updates repaints the viewport once.
+        view = self._primary_view
+        if view is not None:
+            view.setUpdatesEnabled(False)
+        try:
+            # Now, remove the items in the correct order: wires first, then nodes.
+            for wire in wires_to_remove:
+                self.remove_wire(wire)
+
+            for node in nodes_to_remove:
+                self.removeItem(node)
 
-        # After removing items, the super block may have changed.
-        self.realign_diagram_pins()
+            # After removing items, the super block may have changed.
+            self.realign_diagram_pins()
+        finally:
+            if view is not None:
+                view.setUpdatesEnabled(True)
 
     def remove_wire(self, wire: Wire) -> None:
         """
@@ -1730,14 +2508,12 @@ class BlockDiagramScene(QGraphicsScene):
         Args:
             wire (Wire): The wire to be removed.
         """
-        if wire.start_pin and wire in wire.start_pin.wires:
-            wire.start_pin.wires.remove(wire)
-            if hasattr(wire.start_pin, 'update_lock_state'):
-                wire.start_pin.update_lock_state()
-        if wire.end_pin and wire in wire.end_pin.wires:
-            wire.end_pin.wires.remove(wire)
-            if hasattr(wire.end_pin, 'update_lock_state'):
-                wire.end_pin.update_lock_state()
+        if wire.start_pin:
+            wire.start_pin.remove_wire(wire)
+            wire.start_pin.update_lock_state()
+        if wire.end_pin:
+            wire.end_pin.remove_wire(wire)
+            wire.end_pin.update_lock_state()
         self.removeItem(wire)
 
     def create_wire(self, start_pin: Pin, end_pin: Pin) -> Optional[Wire]:
@@ -1782,25 +2558,48 @@ class BlockDiagramScene(QGraphicsScene):
         """
         Calculates and returns the smallest bounding box that contains all Block items.
 
-        This method iterates through all items in the scene, identifies the
-        `Block` instances, and computes their collective bounding rectangle.
+        This method iterates the scene's block registry and computes the
+        collective bounding rectangle.
 
         Returns:
             QRectF: The bounding rectangle that encloses all blocks. Returns
             a default (empty) QRectF if no blocks are present in the scene.
         """
-        total_bounding_box = QRectF()
-        first_block_found = False
+        cached = self._blocks_bbox_cache
+        if cached is not None:
+            return QRectF(cached)
 
-        for item in self.items():
-            if isinstance(item, Block):
-                if not first_block_found:
-                    total_bounding_box = item.sceneBoundingRect()
-                    first_block_found = True
-                else:
-                    total_bounding_box = total_bounding_box.united(item.sceneBoundingRect())
+        if not self._blocks:
+            return QRectF()
+
+        # Reduce over plain floats instead of chaining QRectF.united, which
+        # would allocate a new rect and cross the binding per block.
+        left = top = math.inf
+        right = bottom = -math.inf
+        for block in self._blocks.values():
+            r = block.sceneBoundingRect()
+            x1, y1, x2, y2 = r.left(), r.top(), r.right(), r.bottom()
+            if x1 < left:
+                left = x1
+            if y1 < top:
+                top = y1
+            if x2 > right:
+                right = x2
+            if y2 > bottom:
+                bottom = y2
 
-        return total_bounding_box
+        result = QRectF(left, top, right - left, bottom - top)
+        self._blocks_bbox_cache = result
+        return QRectF(result)
+
+    def invalidate_blocks_bbox(self) -> None:
+        """
+        Drops the memoised blocks bounding box.
+
+        Called by blocks when they move or resize; add/remove invalidation
+        is handled by addItem/removeItem directly.
+        """
+        self._blocks_bbox_cache = None
 
     def get_super_block(self) -> QRectF:
         """
@@ -1824,6 +2623,19 @@ class BlockDiagramScene(QGraphicsScene):
                                         conf.SUPER_BLOCK_MARGIN_Y)
         return blocks_bbox # Return the empty rect if no blocks
 
+    def schedule_diagram_pin_realign(self) -> None:
+        """
+        Requests a diagram pin realignment for the next event loop pass.
+
+        Interactive paths (block drags in particular) can request a realign
+        several times per input event; restarting the zero-interval
+        single-shot timer coalesces all of them into one
+        realign_diagram_pins call. Callers that need the new pin positions
+        immediately (e.g. the optimizer cost evaluation) should keep
+        calling realign_diagram_pins directly.
+        """
+        self._realign_timer.start()
+
     def realign_diagram_pins(self) -> None:
         """
         Re-calculates the positions of all DiagramInputPin and DiagramOutputPin
@@ -1832,12 +2644,15 @@ class BlockDiagramScene(QGraphicsScene):
         if not self._realign_enabled:
             return
 
+        # A synchronous realign supersedes any pending deferred request.
+        self._realign_timer.stop()
+
         super_block = self.get_super_block()
         if super_block.isEmpty():
             return  # Nothing to align to
 
         # --- Align Input Pins ---
-        input_pins = sorted([item for item in self.items() if isinstance(item, DiagramInputPin)], key=lambda p: p.scenePos().y())
+        input_pins = sorted(self._diagram_input_pins.values(), key=lambda p: p.scenePos().y())
         num_input_pins = len(input_pins)
         if num_input_pins > 0:
             super_block_height = super_block.height()
@@ -1847,7 +2662,7 @@ class BlockDiagramScene(QGraphicsScene):
                 pin.setPos(super_block.left(), new_y)
 
         # --- Align Output Pins ---
-        output_pins = sorted([item for item in self.items() if isinstance(item, DiagramOutputPin)], key=lambda p: p.scenePos().y())
+        output_pins = sorted(self._diagram_output_pins.values(), key=lambda p: p.scenePos().y())
         num_output_pins = len(output_pins)
         if num_output_pins > 0:
             super_block_height = super_block.height()
@@ -1906,6 +2721,15 @@ class BlockDiagramView(QGraphicsView):
             parent (Optional[QWidget]): The parent widget. Defaults to None.
         """
         super().__init__(scene, parent)
+        # Register as the scene's primary view so mouse handlers can query
+        # the view transform without rebuilding the views() list per event.
+        if isinstance(scene, BlockDiagramScene):
+            scene.set_primary_view(self)
+        if conf.USE_OPENGL:
+            # Optional GPU viewport for very large diagrams. Imported here
+            # so the default configuration has no OpenGL dependency.
+            from PyQt5.QtWidgets import QOpenGLWidget
+            self.setViewport(QOpenGLWidget())
         self.setRenderHint(QPainter.Antialiasing)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -2004,7 +2828,7 @@ class BlockDiagramView(QGraphicsView):
             event (QWheelEvent): The wheel event.
         """
         zoom_in_factor = conf.ZOOM_STEP_FACTOR
-        zoom_out_factor = 1 / conf.ZOOM_STEP_FACTOR
+        zoom_out_factor = conf.ZOOM_STEP_FACTOR_INV
 
         if event.angleDelta().y() > 0:
             self._zoom(zoom_in_factor, event.pos())
@@ -2019,7 +2843,7 @@ class BlockDiagramView(QGraphicsView):
             event (QKeyEvent): The key press event.
         """
         zoom_in_factor = conf.ZOOM_STEP_FACTOR
-        zoom_out_factor = 1 / conf.ZOOM_STEP_FACTOR
+        zoom_out_factor = conf.ZOOM_STEP_FACTOR_INV
 
         if event.modifiers() == Qt.ControlModifier:
             if event.key() == Qt.Key_Plus or event.key() == Qt.Key_Equal:
@@ -2126,6 +2950,18 @@ class MainWindow(QMainWindow):
         self.scene.unlockAllRequested.connect(self.unlock_all_items)
         self.scene.exportSvgRequested.connect(self.export_to_svg)
 
+        # Track the selected block as the selection evolves, so the
+        # selection-dependent actions read one attribute instead of
+        # scanning selectedItems() every time they fire.
+        self._selected_block: Optional[Block] = None
+        self.scene.selectionChanged.connect(self._on_selection_changed)
+
+        # When > 0, the programmatic create APIs skip the per-item
+        # realign_diagram_pins() call; batch_creation() realigns once at
+        # the end instead. See batch_creation().
+        self._realign_suspended = 0
+        self._realign_pending = False
+
         self._create_toolbar()
 
         # --- Status Bar ---
@@ -2135,6 +2971,9 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         # addPermanentWidget makes it appear on the right side
         self.status_bar.addPermanentWidget(self.progress_bar)
+        # Rate-limits update_progress_bar; see there.
+        self._progress_timer = QElapsedTimer()
+        self._progress_timer.start()
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """
@@ -2153,14 +2992,10 @@ class MainWindow(QMainWindow):
 
     def _is_name_unique(self, name: str, item_class_or_tuple: Union[type, Tuple[type, ...]], item_to_ignore: Optional[QGraphicsItem] = None) -> bool:
         """Checks if a name is unique for a given item type in the scene."""
-        for item in self.scene.items():
-            # Ignore the item being renamed
-            if item == item_to_ignore:
-                continue
-            # Check if an item of the same type and name already exists
-            if isinstance(item, item_class_or_tuple) and hasattr(item, 'name') and item.name == name:
-                return False
-        return True
+        # The scene keys its per-type registries by name, so this is a dict
+        # probe, not a scan. The item being renamed may keep its own name.
+        existing = self.scene.named_item(item_class_or_tuple, name)
+        return existing is None or existing is item_to_ignore
 
     def log_message(self, message: str) -> None:
         """
@@ -2193,15 +3028,40 @@ class MainWindow(QMainWindow):
         self.progress_bar.setMaximum(max_value)
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
+        self._progress_timer.start()
 
     def update_progress_bar(self, value: int) -> None:
-        """Updates the value of the progress bar."""
+        """
+        Updates the value of the progress bar, rate-limited to ~60 Hz.
+
+        Optimizers report every iteration; forwarding each report to the
+        widget would schedule a repaint per iteration. Reports arriving
+        faster than the configured interval are dropped — the next one
+        catches the bar up, and hide_progress_bar ends every run anyway.
+        """
+        if self._progress_timer.elapsed() < conf.PROGRESS_BAR_MIN_UPDATE_INTERVAL_MS:
+            return
+        self._progress_timer.restart()
         self.progress_bar.setValue(value)
 
     def hide_progress_bar(self) -> None:
         """Hides the progress bar from the status bar."""
         self.progress_bar.setVisible(False)
 
+    def _on_selection_changed(self) -> None:
+        """
+        Keeps the tracked selected block in sync with the scene selection.
+
+        Runs once per selection change, which is far rarer than the actions
+        that consume the result.
+        """
+        selected_block = None
+        for item in self.scene.selectedItems():
+            if isinstance(item, Block):
+                selected_block = item
+                break
+        self._selected_block = selected_block
+
     def add_pin_to_selected_block(self) -> None:
         """
         Opens a series of dialogs to add a new pin to the selected block.
@@ -2211,19 +3071,14 @@ class MainWindow(QMainWindow):
         user provides valid input, a new pin is added to the block, and the
         block's size is automatically adjusted.
         """
-        selected_items = self.scene.selectedItems()
-        if not selected_items:
-            self.log_message(conf.UI.Log.NO_BLOCK_SELECTED)
-            return
-
-        selected_block = None
-        for item in selected_items:
-            if isinstance(item, Block):
-                selected_block = item
-                break
-
-        if not isinstance(selected_block, Block): # Ensure it's a Block instance
-            self.log_message(conf.UI.Log.NOT_A_BLOCK)
+        selected_block = self._selected_block
+        if selected_block is None:
+            # Distinguish "nothing selected" from "selection has no block"
+            # only on the failure path, where the scan cost is irrelevant.
+            if self.scene.selectedItems():
+                self.log_message(conf.UI.Log.NOT_A_BLOCK)
+            else:
+                self.log_message(conf.UI.Log.NO_BLOCK_SELECTED)
             return
 
         pin_name, ok = QInputDialog.getText(self, conf.UI.Dialog.NEW_BLOCK_PIN_TITLE, conf.UI.Dialog.NEW_BLOCK_PIN_LABEL)
@@ -2375,11 +3230,8 @@ class MainWindow(QMainWindow):
         Finds and unlocks all locked blocks and wires in the scene.
         """
         unlocked_count = 0
-        for item in self.scene.items():
-            if isinstance(item, Block) and item.is_locked:
-                item.set_locked(False)
-                unlocked_count += 1
-            elif isinstance(item, Wire) and item.is_locked:
+        for item in self.scene.registered_items((Block, Wire)):
+            if item.is_locked:
                 item.set_locked(False)
                 unlocked_count += 1
         if unlocked_count > 0:
@@ -2449,14 +3301,41 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True if the block was found and moved, False otherwise.
         """
-        for item in self.scene.items():
-            if isinstance(item, Block) and item.name == block_name:
-                item.setPos(x, y) # itemChange will handle snapping and realignment
-                self.log_message(conf.UI.Log.BLOCK_MOVED.format(block_name=block_name, x=x, y=y))
-                return True
+        block = self.scene.named_item(Block, block_name)
+        if block is not None:
+            block.setPos(x, y) # itemChange snaps the position; pin realignment is deferred to the event loop
+            self.log_message(conf.render_log(conf.UI.Log.BLOCK_MOVED, block_name=block_name, x=x, y=y))
+            return True
         self.log_message(conf.UI.Log.BLOCK_NOT_FOUND.format(block_name=block_name))
         return False
 
+    def move_blocks(self, block_names: Sequence[str], xs: Sequence[float], ys: Sequence[float]) -> int:
+        """
+        Programmatically moves several blocks in one batch.
+
+        Equivalent to calling move_block once per entry, but viewport
+        repaints are suspended for the whole batch so the scene repaints
+        once at the end. Grid snapping is applied per block by the item's
+        itemChange handler, exactly as for single moves.
+
+        Args:
+            block_names (Sequence[str]): The names of the blocks to move.
+            xs (Sequence[float]): New x-coordinates, parallel to block_names.
+            ys (Sequence[float]): New y-coordinates, parallel to block_names.
+
+        Returns:
+            int: The number of blocks that were found and moved.
+        """
+        moved = 0
+        self.view.setUpdatesEnabled(False)
+        try:
+            for block_name, x, y in zip(block_names, xs, ys):
+                if self.move_block(block_name, x, y):
+                    moved += 1
+        finally:
+            self.view.setUpdatesEnabled(True)
+        return moved
+
     def set_block_pin_order(self, block_name: str, pin_type: PinType, ordered_pin_names: List[str]) -> bool:
         """
         Programmatically sets the vertical order of pins on a block.
@@ -2470,19 +3349,18 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True if the pins were successfully reordered, False otherwise.
         """
-        block = None
-        for item in self.scene.items():
-            if isinstance(item, Block) and item.name == block_name:
-                block = item
-                break
+        block = self.scene.named_item(Block, block_name)
         if not block:
             self.log_message(conf.UI.Log.BLOCK_NOT_FOUND.format(block_name=block_name))
             return False
 
         pins_to_reorder = block.input_pins if pin_type == PinType.INPUT else block.output_pins
 
-        # Validate that the provided list of names matches the existing pins
-        if set(ordered_pin_names) != set(pins_to_reorder.keys()):
+        # Validate that the provided list of names matches the existing pins.
+        # The length check rejects most malformed inputs before hashing
+        # anything, and comparing against the keys view avoids building a
+        # second set while still rejecting duplicated names.
+        if len(ordered_pin_names) != len(pins_to_reorder) or set(ordered_pin_names) != pins_to_reorder.keys():
             self.log_message(conf.UI.Log.BLOCK_PIN_REORDER_MISMATCH.format(block_name=block_name))
             return False
 
@@ -2519,9 +3397,11 @@ class MainWindow(QMainWindow):
             self.log_message(conf.UI.Log.DIAGRAM_PIN_REORDER_INVALID_TYPE)
             return False
 
-        pins_to_reorder = {item.name: item for item in self.scene.items() if isinstance(item, target_class)}
+        pins_to_reorder = {item.name: item for item in self.scene.registered_items(target_class)}
 
-        if set(ordered_pin_names) != set(pins_to_reorder.keys()):
+        # Same validation scheme as set_block_pin_order: length fast-reject,
+        # then a single set compared against the keys view.
+        if len(ordered_pin_names) != len(pins_to_reorder) or set(ordered_pin_names) != pins_to_reorder.keys():
             self.log_message(conf.UI.Log.DIAGRAM_PIN_REORDER_MISMATCH.format(type_name=type_name))
             return False
 
@@ -2536,7 +3416,22 @@ class MainWindow(QMainWindow):
         self.log_message(conf.UI.Log.DIAGRAM_PINS_REORDERED.format(type_name=type_name))
         return True
 
-    def _calculate_intersection_score(self) -> float:
+    def _collect_wires_and_blocks(self) -> Tuple[List[Wire], List[Block]]:
+        """
+        Collects all wires and blocks from the scene's per-type registries.
+
+        Returns:
+            Tuple[List[Wire], List[Block]]: The wires and blocks currently
+            in the scene.
+        """
+        return self.scene.registered_items(Wire), self.scene.registered_items(Block)
+
+    def _calculate_intersection_score(self,
+                                      wires: Optional[List[Wire]] = None,
+                                      blocks: Optional[List[Block]] = None,
+                                      affected_wires: Optional[set] = None,
+                                      affected_blocks: Optional[set] = None,
+                                      score_budget: Optional[float] = None) -> float:
         """
         Calculates the intersection score for the diagram.
 
@@ -2544,15 +3439,61 @@ class MainWindow(QMainWindow):
         proportional to the area of the intersection, providing a more
         granular measure than a simple count.
 
+        Args:
+            wires (List[Wire], optional): Pre-collected wires. Collected from
+                the scene if not provided.
+            blocks (List[Block], optional): Pre-collected blocks. Collected
+                from the scene if not provided.
+            affected_wires (set, optional): If given (together with
+                `affected_blocks`), only pairs involving at least one
+                affected wire or block are scored. Used for incremental
+                cost evaluation.
+            affected_blocks (set, optional): See `affected_wires`.
+            score_budget (float, optional): If given, the accumulation stops
+                and math.inf is returned as soon as the score exceeds this
+                value. Used by callers that only need to know whether the
+                score stays under a rejection threshold.
+
         Returns:
-            float: The total intersection score.
-        """
-        wires = [item for item in self.scene.items() if isinstance(item, Wire)]
-        blocks = [item for item in self.scene.items() if isinstance(item, Block)]
+            float: The total intersection score (restricted to the affected
+            pairs when an affected set is given), or math.inf if the budget
+            was exhausted.
+        """
+        if wires is None or blocks is None:
+            wires, blocks = self._collect_wires_and_blocks()
+        # Read the check mode once; the pair loops below must not pay a
+        # module attribute lookup per pair.
+        detailed = conf.USE_DETAILED_INTERSECTION_CHECK
+        restrict = affected_wires is not None or affected_blocks is not None
+        if restrict:
+            affected_wires = affected_wires or set()
+            affected_blocks = affected_blocks or set()
+        budget = score_budget if score_budget is not None else math.inf
         intersection_score = 0.0
 
+        # Query the Qt geometry once per wire/block instead of once per pair.
+        wire_paths = [wire.path() for wire in wires]
+        block_rects = [block.sceneBoundingRect() for block in blocks]
+        # Conservative axis-aligned bounding boxes for a cheap pre-filter.
+        # controlPointRect() is O(1) on a cached path and always encloses the
+        # curve, so a pair whose boxes are disjoint cannot intersect and the
+        # expensive path-level test can be skipped entirely.
+        wire_rects = [path.controlPointRect() for path in wire_paths]
+        if detailed:
+            # The detailed checks intersect wire.shape() — the centerline
+            # stroked to WIRE_CLICKABLE_WIDTH — so inflate the boxes by half
+            # the stroke width; otherwise two strokes can overlap while
+            # their centerline boxes are disjoint and the pair is skipped.
+            half = conf.WIRE_CLICKABLE_WIDTH / 2
+            wire_rects = [rect.adjusted(-half, -half, half, half) for rect in wire_rects]
+
         # 1. Calculate wire-wire intersections
-        for wire1, wire2 in itertools.combinations(wires, 2):
+        for i, j in itertools.combinations(range(len(wires)), 2):
+            if not wire_rects[i].intersects(wire_rects[j]):
+                continue
+            wire1, wire2 = wires[i], wires[j]
+            if restrict and wire1 not in affected_wires and wire2 not in affected_wires:
+                continue
             pins1 = {wire1.start_pin, wire1.end_pin}
             pins2 = {wire2.start_pin, wire2.end_pin}
 
@@ -2560,46 +3501,76 @@ class MainWindow(QMainWindow):
             # are expected to intersect at the pin.
             if pins1.isdisjoint(pins2):
                 # Use the wire's shape (the clickable area) for intersection.
-                if conf.USE_DETAILED_INTERSECTION_CHECK:
+                if detailed:
                     intersection = wire1.shape().intersected(wire2.shape())
                     if not intersection.isEmpty():
                         # The penalty is the area of the bounding box of the intersection.
                         penalty = intersection.boundingRect().width() * intersection.boundingRect().height()
                         intersection_score += penalty
                 else:
-                    if wire1.path().intersects(wire2.path()):
+                    if wire_paths[i].intersects(wire_paths[j]):
                         intersection_score += 1.0
+                if intersection_score > budget:
+                    return math.inf
 
         # 2. Calculate wire-block intersections
-        for wire in wires:
+        # Bucket the block rects in a uniform grid so each wire only tests
+        # the blocks sharing a cell with its bounding box; far-apart pairs
+        # never even reach the rectangle test.
+        grid_cell = conf.GRID_SIZE * 8
+        block_grid = _bucket_rects_by_cell(block_rects, grid_cell)
+        # The detailed branch needs each block rect as a QPainterPath; build
+        # those lazily, once per block, instead of once per surviving pair.
+        block_paths: List[Optional[QPainterPath]] = [None] * len(blocks)
+        for i, wire in enumerate(wires):
             connected_blocks = {p.parent_block for p in (wire.start_pin, wire.end_pin) if p and p.parent_block}
-            wire_shape = wire.shape()
-            for block in blocks:
-                if block not in connected_blocks:                    
-                    block_path = QPainterPath()
-                    block_path.addRect(block.sceneBoundingRect())
-                    if conf.USE_DETAILED_INTERSECTION_CHECK:
+            wire_shape = wire.shape() if detailed else None
+            wire_affected = not restrict or wire in affected_wires
+            candidate_indices: set = set()
+            for key in _grid_cells(wire_rects[i], grid_cell):
+                candidate_indices.update(block_grid.get(key, ()))
+            # Sorted for a deterministic float-accumulation order.
+            for j in sorted(candidate_indices):
+                block = blocks[j]
+                if not wire_rects[i].intersects(block_rects[j]):
+                    continue
+                if restrict and not wire_affected and block not in affected_blocks:
+                    continue
+                if block not in connected_blocks:
+                    if detailed:
+                        block_path = block_paths[j]
+                        if block_path is None:
+                            block_path = QPainterPath()
+                            block_path.addRect(block_rects[j])
+                            block_paths[j] = block_path
                         intersection = wire_shape.intersected(block_path)
                         if not intersection.isEmpty():
                             penalty = intersection.boundingRect().width() * intersection.boundingRect().height()
                             intersection_score += penalty
                     else:
-                        if wire.path().intersects(block.sceneBoundingRect()):
+                        if wire_paths[i].intersects(block_rects[j]):
                             intersection_score += 1.0
+                    if intersection_score > budget:
+                        return math.inf
 
         return intersection_score
 
-    def _calculate_total_wire_length(self) -> float:
+    def _calculate_total_wire_length(self, wires: Optional[List[Wire]] = None) -> float:
         """
         Calculates the total length of all wires in the diagram.
 
+        Args:
+            wires (List[Wire], optional): Pre-collected wires. Collected from
+                the scene if not provided.
+
         Returns:
             float: The sum of all wire lengths, in scene units.
         """
+        if wires is None:
+            wires = self.scene.registered_items(Wire)
         total_length = 0.0
-        wires = [item for item in self.scene.items() if isinstance(item, Wire)]
         for wire in wires:
-            total_length += wire.path().length()
+            total_length += wire.path_length()
         return total_length
 
     def calculate_diagram_cost(self, cost_params: Optional[Dict[str, Any]] = None) -> float:
@@ -2623,17 +3594,76 @@ class MainWindow(QMainWindow):
         intersection_weight = cost_params.get('intersection_weight', conf.COST_FUNCTION_INTERSECTION_WEIGHT)
         wirelength_weight = cost_params.get('wirelength_weight', conf.COST_FUNCTION_WIRELENGTH_WEIGHT)
 
-        intersection_score = self._calculate_intersection_score()
-        wire_length_score = self._calculate_total_wire_length()
+        # Collect once and share between the two metrics, so each cost
+        # evaluation walks the scene a single time.
+        wires, blocks = self._collect_wires_and_blocks()
+        intersection_score = self._calculate_intersection_score(wires, blocks)
+        wire_length_score = self._calculate_total_wire_length(wires)
 
         total_cost = (intersection_score * intersection_weight) + \
                      (wire_length_score * wirelength_weight)
 
-        self.log_message(conf.UI.Log.DIAGRAM_COST_BREAKDOWN.format(intersection_score=intersection_score, wire_length_score=wire_length_score))
-        self.log_message(conf.UI.Log.DIAGRAM_COST_TOTAL.format(cost=total_cost))
+        self.log_message(conf.render_log(conf.UI.Log.DIAGRAM_COST_BREAKDOWN, intersection_score=intersection_score, wire_length_score=wire_length_score))
+        self.log_message(conf.render_log(conf.UI.Log.DIAGRAM_COST_TOTAL, cost=total_cost))
 
         return total_cost
 
+    def calculate_partial_diagram_cost(self,
+                                       affected_wires: List[Wire],
+                                       affected_blocks: List[Block],
+                                       cost_params: Optional[Dict[str, Any]] = None,
+                                       cost_budget: Optional[float] = None) -> float:
+        """
+        Calculates only the cost terms involving the given wires and blocks.
+
+        This is the building block for incremental cost evaluation: when a
+        move only changes the geometry of a few items, the cost delta is the
+        difference between this partial cost evaluated after and before the
+        move, while all other terms cancel out.
+
+        Args:
+            affected_wires (List[Wire]): Wires whose geometry the move changes.
+            affected_blocks (List[Block]): Blocks whose geometry the move changes.
+            cost_params (Dict[str, Any], optional): Same weights as
+                `calculate_diagram_cost`.
+            cost_budget (float, optional): If given, the evaluation stops
+                and returns math.inf as soon as the weighted partial cost
+                provably exceeds this value. Used by the optimizer when any
+                cost above the budget leads to a certain rejection.
+
+        Returns:
+            float: The weighted cost contribution of the affected items, or
+            math.inf if the budget was exhausted.
+        """
+        if cost_params is None:
+            cost_params = {}
+
+        intersection_weight = cost_params.get('intersection_weight', conf.COST_FUNCTION_INTERSECTION_WEIGHT)
+        wirelength_weight = cost_params.get('wirelength_weight', conf.COST_FUNCTION_WIRELENGTH_WEIGHT)
+
+        wires, blocks = self._collect_wires_and_blocks()
+
+        # The length term is the cheap linear sweep; evaluating it first
+        # leaves the tightest possible budget for the quadratic term.
+        wire_length_score = self._calculate_total_wire_length(affected_wires)
+
+        score_budget = None
+        if cost_budget is not None and intersection_weight > 0:
+            score_budget = (cost_budget - wire_length_score * wirelength_weight) / intersection_weight
+            if score_budget < 0:
+                return math.inf
+
+        intersection_score = self._calculate_intersection_score(
+            wires, blocks,
+            affected_wires=set(affected_wires),
+            affected_blocks=set(affected_blocks),
+            score_budget=score_budget)
+        if intersection_score == math.inf:
+            return math.inf
+
+        return (intersection_score * intersection_weight) + \
+               (wire_length_score * wirelength_weight)
+
     def optimize_placement(self) -> None:
         """
         Gathers optimizable items and runs the placement optimization algorithm.
@@ -2647,6 +3677,12 @@ class MainWindow(QMainWindow):
         
         self.optimizer_is_running = True
         self.view.setEnabled(False)
+        # Suspend viewport repaints for the duration of the run: every trial
+        # moves items and would otherwise schedule a repaint each time the
+        # loop pumps the event queue. The progress bar lives outside the
+        # view, so feedback is unaffected; re-enabling repaints the final
+        # layout once.
+        self.view.setUpdatesEnabled(False)
         try:
             self._run_optimizer_logic()
         finally:
@@ -2654,6 +3690,7 @@ class MainWindow(QMainWindow):
             # cleaned up, regardless of whether the optimizer completes or is cancelled.
             self.optimizer_is_running = False
             self.hide_progress_bar()
+            self.view.setUpdatesEnabled(True)
             self.view.setEnabled(True)
 
             # If a shutdown was requested, re-trigger the close event now that the
@@ -2661,6 +3698,45 @@ class MainWindow(QMainWindow):
             if self.is_shutting_down:
                 self.close()
 
+    def _build_possible_moves(self) -> List[Dict[str, Any]]:
+        """
+        Builds the list of optimization "moves" from the current scene state.
+
+        The list is derived from the per-type registries, so construction is
+        O(blocks + diagram pins). It is rebuilt on every optimizer run
+        rather than cached between runs: the move list depends on the item
+        set, pin counts and lock flags, all of which the user can change
+        between runs, and restarts within a run already share one list.
+
+        Returns:
+            List[Dict[str, Any]]: The move descriptors for the optimizer.
+        """
+        blocks = self.scene.registered_items(Block)
+        diagram_inputs = self.scene.registered_items(DiagramInputPin)
+        diagram_outputs = self.scene.registered_items(DiagramOutputPin)
+
+        # Reorder moves carry their current pin order under conf.Key.ORDER,
+        # maintained by the optimizer on accept/revert, so the evaluator
+        # never has to re-derive it by sorting per trial.
+        possible_moves = []
+        for block in blocks:
+            if not block.is_locked:
+                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.MOVE_BLOCK, conf.Key.BLOCK: block})
+        for block in blocks:
+            if len(block.input_pins) > 1 and not any(p.is_locked for p in block.input_pins.values()):
+                order = sorted(block.input_pins.keys(), key=lambda k: block.input_pins[k].index)
+                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_BLOCK_PINS, conf.Key.BLOCK: block, conf.Key.PIN_TYPE: PinType.INPUT, conf.Key.ORDER: order})
+            if len(block.output_pins) > 1 and not any(p.is_locked for p in block.output_pins.values()):
+                order = sorted(block.output_pins.keys(), key=lambda k: block.output_pins[k].index)
+                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_BLOCK_PINS, conf.Key.BLOCK: block, conf.Key.PIN_TYPE: PinType.OUTPUT, conf.Key.ORDER: order})
+        if len(diagram_inputs) > 1 and not any(p.is_locked for p in diagram_inputs):
+            order = [p.name for p in sorted(diagram_inputs, key=lambda p: p.scenePos().y())]
+            possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_DIAGRAM_PINS, conf.Key.PIN_TYPE: PinType.OUTPUT, conf.Key.PINS: diagram_inputs, conf.Key.ORDER: order})
+        if len(diagram_outputs) > 1 and not any(p.is_locked for p in diagram_outputs):
+            order = [p.name for p in sorted(diagram_outputs, key=lambda p: p.scenePos().y())]
+            possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_DIAGRAM_PINS, conf.Key.PIN_TYPE: PinType.INPUT, conf.Key.PINS: diagram_outputs, conf.Key.ORDER: order})
+        return possible_moves
+
     def _run_optimizer_logic(self) -> None:
         """
         Helper method that prepares data and wraps the optimizer call.
@@ -2671,31 +3747,13 @@ class MainWindow(QMainWindow):
         """
         self.log_message(conf.UI.Log.OPTIMIZER_START)
 
-        # --- Gather all optimizable items ---
-        blocks = [item for item in self.scene.items() if isinstance(item, Block)]
-        diagram_inputs = [item for item in self.scene.items() if isinstance(item, DiagramInputPin)]
-        diagram_outputs = [item for item in self.scene.items() if isinstance(item, DiagramOutputPin)]
-
-        if not blocks:
+        if not self.scene.registered_items(Block):
             message = conf.UI.Log.OPTIMIZER_NO_BLOCKS
             self.log_message(message)
             self.show_status_message(message, conf.STATUS_BAR_TIMEOUT_MS)
             return # Exit gracefully
 
-        # --- Build a list of possible optimization "moves" ---
-        possible_moves = []
-        for block in blocks:
-            if not block.is_locked:
-                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.MOVE_BLOCK, conf.Key.BLOCK: block})
-        for block in blocks:
-            if len(block.input_pins) > 1 and not any(p.is_locked for p in block.input_pins.values()):
-                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_BLOCK_PINS, conf.Key.BLOCK: block, conf.Key.PIN_TYPE: PinType.INPUT})
-            if len(block.output_pins) > 1 and not any(p.is_locked for p in block.output_pins.values()):
-                possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_BLOCK_PINS, conf.Key.BLOCK: block, conf.Key.PIN_TYPE: PinType.OUTPUT})
-        if len(diagram_inputs) > 1 and not any(p.is_locked for p in diagram_inputs):
-            possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_DIAGRAM_PINS, conf.Key.PIN_TYPE: PinType.OUTPUT, conf.Key.PINS: diagram_inputs})
-        if len(diagram_outputs) > 1 and not any(p.is_locked for p in diagram_outputs):
-            possible_moves.append({conf.Key.MOVE_TYPE: MoveType.REORDER_DIAGRAM_PINS, conf.Key.PIN_TYPE: PinType.INPUT, conf.Key.PINS: diagram_outputs})
+        possible_moves = self._build_possible_moves()
 
         # Centralized check for optimizable moves.
         if not possible_moves:
@@ -2725,6 +3783,41 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, conf.UI.Dialog.OPTIMIZATION_FAILED_TITLE, conf.UI.Dialog.OPTIMIZER_UNEXPECTED_ERROR_MSG)
 
     # --- Programmatic API ---
+    @contextlib.contextmanager
+    def batch_creation(self):
+        """
+        Context manager that defers diagram pin realignment during bulk creation.
+
+        The programmatic create APIs (`create_block`, `create_diagram_input`,
+        `create_diagram_output`) each realign all diagram pins after adding
+        their item, which is O(pins) work repeated for every call. When
+        creating many items in a row, wrap the calls in this context manager:
+        the per-item realignments are skipped and a single realignment is
+        performed on exit (only if something was actually created). Nested
+        uses are allowed; the realignment happens when the outermost block
+        exits.
+        """
+        self._realign_suspended += 1
+        try:
+            yield
+        finally:
+            self._realign_suspended -= 1
+            if not self._realign_suspended and self._realign_pending:
+                self._realign_pending = False
+                self.scene.realign_diagram_pins()
+
+    def _realign_after_creation(self) -> None:
+        """
+        Realigns diagram pins after a programmatic create, or defers it.
+
+        Inside a `batch_creation` block the realignment is only recorded as
+        pending; otherwise it runs immediately.
+        """
+        if self._realign_suspended:
+            self._realign_pending = True
+        else:
+            self.scene.realign_diagram_pins()
+
     def _create_item(self, item_class: type, name: str, log_format_str: str, pos: Optional[QPointF] = None) -> Optional[QGraphicsItem]:
         """
         Generic helper to programmatically create and add an item to the scene.
@@ -2804,7 +3897,7 @@ class MainWindow(QMainWindow):
                     block.add_output_pin(pin_name)
             # After adding a block and its pins, the super block has changed.
             # Realign all diagram pins to the new super block boundaries.
-            self.scene.realign_diagram_pins()
+            self._realign_after_creation()
         return block
 
     def create_diagram_input(self, name: str) -> Optional[DiagramInputPin]:
@@ -2826,7 +3919,7 @@ class MainWindow(QMainWindow):
         new_item = DiagramInputPin(name=name, scene_for_auto_placement=self.scene, log_func=self.log_message)
         self.scene.addItem(new_item)
 
-        self.scene.realign_diagram_pins()
+        self._realign_after_creation()
 
         scene_pos = new_item.scenePos() # Get position after realignment
         self.log_message(conf.UI.Log.ADDED_NEW_DIAGRAM_INPUT.format(name=name, pos_x=scene_pos.x(), pos_y=scene_pos.y()))
@@ -2851,7 +3944,7 @@ class MainWindow(QMainWindow):
         new_item = DiagramOutputPin(name=name, scene_for_auto_placement=self.scene, log_func=self.log_message)
         self.scene.addItem(new_item)
 
-        self.scene.realign_diagram_pins()
+        self._realign_after_creation()
 
         scene_pos = new_item.scenePos() # Get position after realignment
         self.log_message(conf.UI.Log.ADDED_NEW_DIAGRAM_OUTPUT.format(name=name, pos_x=scene_pos.x(), pos_y=scene_pos.y()))
@@ -2879,8 +3972,15 @@ class MainWindow(QMainWindow):
             file_path += '.svg'
 
         # Get the rectangle of the visible area in scene coordinates.
-        # This captures the current pan and zoom of the view.
-        source_rect = self.view.mapToScene(self.view.viewport().rect()).boundingRect()
+        # This captures the current pan and zoom of the view. The view only
+        # ever scales and translates, so mapping the two corners yields the
+        # same rect as mapping the whole viewport polygon, without the
+        # intermediate QPolygonF.
+        # Note: QRect.bottomRight() is (width-1, height-1); map the true
+        # corner so the export does not lose the last device pixel.
+        viewport_rect = self.view.viewport().rect()
+        source_rect = QRectF(self.view.mapToScene(viewport_rect.topLeft()),
+                             self.view.mapToScene(QPoint(viewport_rect.width(), viewport_rect.height()))).normalized()
 
         svg_generator = QSvgGenerator()
         svg_generator.setFileName(file_path)
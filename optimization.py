@@ -4,67 +4,225 @@ This module contains algorithms for optimizing the block diagram layout.
 """
 
 import random
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Callable, Union
 
 from PyQt5.QtCore import QPointF, QRectF
 from PyQt5.QtWidgets import QApplication
 
 import diagrams.conf as conf
-from diagrams.engine import PinType, MoveType, _is_rect_overlapping, OptimizationError
+from diagrams.engine import PinType, MoveType, _is_rect_overlapping, _snap_to_grid, OptimizationError
 
 import math # For simulated annealing
 if TYPE_CHECKING:
     from diagrams.engine import MainWindow
 
-def _apply_and_evaluate_move(main_window: 'MainWindow', move: Dict[str, Any], move_step: float, cost_params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[float, Callable]]:
+@dataclass(frozen=True, slots=True)
+class RHCParams:
+    """
+    Parameters for Randomized Hill Climbing.
+
+    A frozen dataclass is used instead of a plain dict so that parameter
+    reads are C-level slot lookups and the configuration is immutable and
+    hashable. Defaults come from conf.py.
+    """
+    iterations: int = conf.OPTIMIZER_RHC_DEFAULT_ITERATIONS
+    move_step_grid_units: int = conf.OPTIMIZER_RHC_DEFAULT_MOVE_STEP_GRID_UNITS
+    reporting_interval: int = conf.OPTIMIZER_RHC_DEFAULT_REPORTING_INTERVAL
+    intersection_weight: float = conf.COST_FUNCTION_INTERSECTION_WEIGHT
+    wirelength_weight: float = conf.COST_FUNCTION_WIRELENGTH_WEIGHT
+
+@dataclass(frozen=True, slots=True)
+class SAParams:
+    """
+    Parameters for Simulated Annealing.
+
+    A frozen dataclass is used instead of a plain dict so that parameter
+    reads are C-level slot lookups and the configuration is immutable and
+    hashable. Defaults come from conf.py.
+    """
+    iterations: int = conf.OPTIMIZER_SA_DEFAULT_ITERATIONS
+    initial_temp: float = conf.OPTIMIZER_SA_DEFAULT_INITIAL_TEMP
+    cooling_rate: float = conf.OPTIMIZER_SA_DEFAULT_COOLING_RATE
+    move_step_grid_units: int = conf.OPTIMIZER_SA_DEFAULT_MOVE_STEP_GRID_UNITS
+    reporting_interval: int = conf.OPTIMIZER_SA_DEFAULT_REPORTING_INTERVAL
+    intersection_weight: float = conf.COST_FUNCTION_INTERSECTION_WEIGHT
+    wirelength_weight: float = conf.COST_FUNCTION_WIRELENGTH_WEIGHT
+    n_restarts: int = conf.OPTIMIZER_SA_DEFAULT_N_RESTARTS
+
+def _snapshot_layout(possible_moves: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Captures the position and pin orders of every item the optimizer can touch.
+
+    The snapshot is derived from the move list itself, so it covers exactly
+    the state that an optimization run is able to change and nothing else.
+
+    Args:
+        possible_moves (List[Dict[str, Any]]): The optimizer's move list.
+
+    Returns:
+        List[Tuple]: An opaque snapshot for _restore_layout().
+    """
+    snapshot = []
+    for move in possible_moves:
+        move_type = move[conf.Key.MOVE_TYPE]
+        if move_type == MoveType.MOVE_BLOCK:
+            block = move[conf.Key.BLOCK]
+            snapshot.append((move_type, block.name, block.pos()))
+        elif move_type == MoveType.REORDER_BLOCK_PINS:
+            block, pin_type = move[conf.Key.BLOCK], move[conf.Key.PIN_TYPE]
+            snapshot.append((move_type, block.name, pin_type, list(move[conf.Key.ORDER])))
+        elif move_type == MoveType.REORDER_DIAGRAM_PINS:
+            pin_type = move[conf.Key.PIN_TYPE]
+            snapshot.append((move_type, pin_type, list(move[conf.Key.ORDER])))
+    return snapshot
+
+def _restore_layout(main_window: 'MainWindow', snapshot: List[Tuple], possible_moves: Optional[List[Dict[str, Any]]] = None) -> None:
+    """
+    Restores a layout previously captured by _snapshot_layout().
+
+    Args:
+        main_window (MainWindow): The main application window instance.
+        snapshot (List[Tuple]): The snapshot to restore.
+        possible_moves (List[Dict[str, Any]], optional): The move list the
+            snapshot was built from. When given, the pin orders carried by
+            the reorder moves are re-synced to the restored layout; the
+            snapshot entries align with the move list by index.
+    """
+    for index, entry in enumerate(snapshot):
+        move_type = entry[0]
+        if move_type == MoveType.MOVE_BLOCK:
+            _, name, pos = entry
+            main_window.move_block(name, pos.x(), pos.y())
+        elif move_type == MoveType.REORDER_BLOCK_PINS:
+            _, name, pin_type, order = entry
+            main_window.set_block_pin_order(name, pin_type, order)
+            if possible_moves is not None:
+                possible_moves[index][conf.Key.ORDER] = list(order)
+        elif move_type == MoveType.REORDER_DIAGRAM_PINS:
+            _, pin_type, order = entry
+            main_window.set_diagram_pin_order(pin_type, order)
+            if possible_moves is not None:
+                possible_moves[index][conf.Key.ORDER] = list(order)
+
+def _wires_of_block(block: Any) -> List[Any]:
+    """Returns all wires connected to any pin of the given block, deduplicated."""
+    wires = []
+    for pin in block.input_pins.values():
+        wires.extend(pin.wires)
+    for pin in block.output_pins.values():
+        wires.extend(pin.wires)
+    # A feedback wire from one of the block's outputs to one of its own
+    # inputs appears under both pins; dedupe so the wire-length term of the
+    # partial cost does not count it twice. dict.fromkeys preserves order.
+    return list(dict.fromkeys(wires))
+
+def _apply_and_evaluate_move(main_window: 'MainWindow', move: Dict[str, Any], move_step: float, cost_params: Optional[Dict[str, Any]] = None, current_cost: Optional[float] = None, accept_delta_bound: Optional[float] = None) -> Optional[Tuple[float, Callable]]:
     """
     Helper function to apply a move, calculate new cost, and return a revert function.
 
     Args:
         cost_params (Dict[str, Any], optional): Parameters for the cost function,
             such as weights for different metrics.
+        current_cost (float, optional): The cost of the diagram before the
+            move. When provided, moves are evaluated incrementally: only the
+            cost terms involving the moved/rerouted items are re-scored, and
+            the new cost is derived from the delta.
+        accept_delta_bound (float, optional): The largest cost increase the
+            caller's strategy could still accept. When provided together
+            with current_cost, the post-move evaluation stops early (and
+            reports math.inf) once the delta provably exceeds the bound,
+            since the move is then a certain rejection either way.
 
     Returns:
         Optional[Tuple[float, Callable]]: A tuple containing the new cost and a
         revert function if the move was valid. Returns None if the move was
         invalid (e.g., caused a collision).
     """
-    if move[conf.Key.MOVE_TYPE] == MoveType.MOVE_BLOCK:
+    # Read the move type and the hot module attributes once per trial; the
+    # branch chain and snap math below must not repeat the dict/module walks.
+    move_type = move[conf.Key.MOVE_TYPE]
+    if move_type == MoveType.MOVE_BLOCK:
         block = move[conf.Key.BLOCK]
         # Defensive check: do not move a locked block.
         if block.is_locked:
             return None
         original_pos = block.pos()
         new_pos = original_pos + QPointF(random.uniform(-move_step, move_step), random.uniform(-move_step, move_step))
-        snapped_x = round(new_pos.x() / conf.GRID_SIZE) * conf.GRID_SIZE
-        snapped_y = round(new_pos.y() / conf.GRID_SIZE) * conf.GRID_SIZE
-        snapped_pos = QPointF(snapped_x, snapped_y)
+        # Same snapper the scene uses for interactive moves, including its
+        # integer fast path for power-of-two grids.
+        snapped_pos = QPointF(_snap_to_grid(new_pos.x()), _snap_to_grid(new_pos.y()))
 
         proposed_rect = QRectF(snapped_pos, block.rect().size())
         if _is_rect_overlapping(main_window.scene, proposed_rect, block):
             return None
 
+        # A block move only changes the terms involving the block itself and
+        # the wires attached to it; all other cost terms cancel out in the
+        # delta, so only the affected terms are scored before and after.
+        if current_cost is not None:
+            affected_wires = _wires_of_block(block)
+            partial_before = main_window.calculate_partial_diagram_cost(affected_wires, [block], cost_params=cost_params)
+
         main_window.move_block(block.name, snapped_pos.x(), snapped_pos.y())
         revert_func = lambda: main_window.move_block(block.name, original_pos.x(), original_pos.y())
 
-    elif move[conf.Key.MOVE_TYPE] == MoveType.REORDER_BLOCK_PINS:
+        if current_cost is not None:
+            budget = None if accept_delta_bound is None else partial_before + accept_delta_bound
+            partial_after = main_window.calculate_partial_diagram_cost(affected_wires, [block], cost_params=cost_params, cost_budget=budget)
+            return current_cost - partial_before + partial_after, revert_func
+
+    elif move_type == MoveType.REORDER_BLOCK_PINS:
         block, pin_type = move[conf.Key.BLOCK], move[conf.Key.PIN_TYPE]
-        pins_dict = block.input_pins if pin_type == PinType.INPUT else block.output_pins
-        original_order = sorted(pins_dict.keys(), key=lambda k: pins_dict[k].index)
+        # The move carries its current order, so no per-trial sort is needed;
+        # the accept/revert paths below keep it in sync with the scene.
+        original_order = move[conf.Key.ORDER]
         new_order = original_order[:]
         random.shuffle(new_order)
 
+        # Reordering pins only reroutes the wires attached to the block; the
+        # block rectangle itself stays put, so no blocks are affected.
+        if current_cost is not None:
+            affected_wires = _wires_of_block(block)
+            partial_before = main_window.calculate_partial_diagram_cost(affected_wires, [], cost_params=cost_params)
+
         main_window.set_block_pin_order(block.name, pin_type, new_order)
-        revert_func = lambda: main_window.set_block_pin_order(block.name, pin_type, original_order)
+        move[conf.Key.ORDER] = new_order
+
+        def revert_func():
+            move[conf.Key.ORDER] = original_order
+            main_window.set_block_pin_order(block.name, pin_type, original_order)
+
+        if current_cost is not None:
+            budget = None if accept_delta_bound is None else partial_before + accept_delta_bound
+            partial_after = main_window.calculate_partial_diagram_cost(affected_wires, [], cost_params=cost_params, cost_budget=budget)
+            return current_cost - partial_before + partial_after, revert_func
 
-    elif move[conf.Key.MOVE_TYPE] == MoveType.REORDER_DIAGRAM_PINS:
+    elif move_type == MoveType.REORDER_DIAGRAM_PINS:
         pin_type, pins = move[conf.Key.PIN_TYPE], move[conf.Key.PINS]
-        original_order = [p.name for p in sorted(pins, key=lambda p: p.scenePos().y())]
+        # As above: the carried order replaces the per-trial sort, which for
+        # diagram pins also saves a scenePos() roundtrip per pin.
+        original_order = move[conf.Key.ORDER]
         new_order = original_order[:]
         random.shuffle(new_order)
 
+        # Realignment only repositions the pins of the reordered group, so
+        # the affected wires are exactly the ones attached to those pins.
+        if current_cost is not None:
+            affected_wires = [wire for pin in pins for wire in pin.wires]
+            partial_before = main_window.calculate_partial_diagram_cost(affected_wires, [], cost_params=cost_params)
+
         main_window.set_diagram_pin_order(pin_type, new_order)
-        revert_func = lambda: main_window.set_diagram_pin_order(pin_type, original_order)
+        move[conf.Key.ORDER] = new_order
+
+        def revert_func():
+            move[conf.Key.ORDER] = original_order
+            main_window.set_diagram_pin_order(pin_type, original_order)
+
+        if current_cost is not None:
+            budget = None if accept_delta_bound is None else partial_before + accept_delta_bound
+            partial_after = main_window.calculate_partial_diagram_cost(affected_wires, [], cost_params=cost_params, cost_budget=budget)
+            return current_cost - partial_before + partial_after, revert_func
     else:
         return None
 
@@ -80,23 +238,36 @@ def _run_optimization_loop(
     cost_params: Dict[str, Any],
     strategy_func: Callable[['MainWindow', float, float, Dict[str, Any]], bool],
     strategy_state: Dict[str, Any],
-    post_iteration_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+    post_iteration_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
+    delta_bound_func: Optional[Callable[[Dict[str, Any]], float]] = None
 ) -> float:
 
-    """A generic optimization loop that uses a strategy pattern."""
+    """
+    A generic optimization loop that uses a strategy pattern.
+
+    When `delta_bound_func` is given, it maps the strategy state to the
+    largest cost increase the strategy could still accept; the bound is
+    passed to the move evaluation so hopeless trials stop scoring early.
+    """
     # --- Initial State Setup ---
     main_window.show_progress_bar(iterations)
     current_cost = main_window.calculate_diagram_cost(cost_params=cost_params)
     main_window.log_message(conf.UI.Log.OPTIMIZER_INITIAL_COST.format(cost=current_cost))
 
+    # Bind the per-iteration callables to locals once; LOAD_FAST is the
+    # cheapest lookup the interpreter has for this hot loop.
+    choose_move = random.choice
+    update_progress_bar = main_window.update_progress_bar
+
     # --- Main Loop ---
     for i in range(iterations):
         if main_window.is_shutting_down:
             main_window.log_message(conf.UI.Log.OPTIMIZER_CANCELLED)
             break
 
-        move = random.choice(possible_moves)
-        result = _apply_and_evaluate_move(main_window, move, move_step, cost_params=cost_params)
+        move = choose_move(possible_moves)
+        accept_delta_bound = delta_bound_func(strategy_state) if delta_bound_func else None
+        result = _apply_and_evaluate_move(main_window, move, move_step, cost_params=cost_params, current_cost=current_cost, accept_delta_bound=accept_delta_bound)
 
         if result is None:
             continue
@@ -111,9 +282,17 @@ def _run_optimization_loop(
         if post_iteration_hook:
             post_iteration_hook(strategy_state)
 
-        main_window.update_progress_bar(i + 1)
+        update_progress_bar(i + 1)
         if (i + 1) % reporting_interval == 0:
-            main_window.log_message(conf.UI.Log.OPTIMIZER_ITERATION_STATUS.format(iteration=i+1, total_iterations=iterations, cost=current_cost))
+            # Block moves defer diagram pin realignment to the event loop;
+            # flush it now so the full evaluation below (and the baseline it
+            # establishes) scores the realigned geometry, instead of letting
+            # processEvents() move the pins right after the re-sync.
+            main_window.scene.realign_diagram_pins()
+            # Re-sync from a full evaluation so floating-point drift from the
+            # incremental deltas cannot accumulate over a long run.
+            current_cost = main_window.calculate_diagram_cost(cost_params=cost_params)
+            main_window.log_message(conf.render_log(conf.UI.Log.OPTIMIZER_ITERATION_STATUS, iteration=i+1, total_iterations=iterations, cost=current_cost))
             QApplication.processEvents()
 
     return current_cost
@@ -133,7 +312,7 @@ def _hill_climbing_strategy(main_window: 'MainWindow', current_cost: float, new_
     """
     return new_cost < current_cost
 
-def run_randomized_hill_climbing(main_window: 'MainWindow', possible_moves: List[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> float:
+def run_randomized_hill_climbing(main_window: 'MainWindow', possible_moves: List[Dict[str, Any]], params: Optional[Union[RHCParams, Dict[str, Any]]] = None) -> float:
     """
     Runs a randomized hill-climbing optimization algorithm.
 
@@ -144,33 +323,37 @@ def run_randomized_hill_climbing(main_window: 'MainWindow', possible_moves: List
         main_window (MainWindow): The main application window instance.
         possible_moves (List[Dict[str, Any]]): A list of possible optimization
             moves (e.g., moving a block, reordering pins).
-        params (Dict[str, Any], optional): A dictionary of parameters for the
-            algorithm, such as 'iterations' and 'move_step_grid_units'.
+        params (RHCParams or Dict[str, Any], optional): The algorithm
+            parameters. A plain dict of RHCParams field names is also
+            accepted for backward compatibility.
 
     Returns:
         float: The final cost score of the diagram.
     """
     if params is None:
-        params = {}
+        params = RHCParams()
+    elif isinstance(params, dict):
+        params = RHCParams(**params)
 
-    # Get parameters, using conf.py for defaults
-    iterations = params.get('iterations', conf.OPTIMIZER_RHC_DEFAULT_ITERATIONS)
-    move_step_grid_units = params.get('move_step_grid_units', conf.OPTIMIZER_RHC_DEFAULT_MOVE_STEP_GRID_UNITS)
-    reporting_interval = params.get('reporting_interval', conf.OPTIMIZER_RHC_DEFAULT_REPORTING_INTERVAL)
-    move_step = conf.GRID_SIZE * move_step_grid_units
+    move_step = conf.GRID_SIZE * params.move_step_grid_units
+    cost_params = {'intersection_weight': params.intersection_weight,
+                   'wirelength_weight': params.wirelength_weight}
 
-    main_window.log_message(conf.UI.Log.OPTIMIZER_RHC_PARAMS.format(iterations=iterations, move_step_grid_units=move_step_grid_units))
+    main_window.log_message(conf.UI.Log.OPTIMIZER_RHC_PARAMS.format(iterations=params.iterations, move_step_grid_units=params.move_step_grid_units))
 
     return _run_optimization_loop(
         main_window,
         possible_moves,
-        iterations=iterations,
+        iterations=params.iterations,
         move_step=move_step,
-        reporting_interval=reporting_interval,
-        cost_params=params,
+        reporting_interval=params.reporting_interval,
+        cost_params=cost_params,
         strategy_func=_hill_climbing_strategy,
         strategy_state={},
-        post_iteration_hook=None
+        post_iteration_hook=None,
+        # Hill climbing only ever accepts strict improvements, so any trial
+        # whose delta reaches zero can stop scoring immediately.
+        delta_bound_func=lambda state: 0.0
     )
 
 def _simulated_annealing_strategy(main_window: 'MainWindow', current_cost: float, new_cost: float, state: Dict[str, Any]) -> bool:
@@ -194,14 +377,21 @@ def _simulated_annealing_strategy(main_window: 'MainWindow', current_cost: float
     if temperature < conf.OPTIMIZER_SA_MIN_TEMPERATURE: # Effectively zero, no chance to accept a bad move
         return False
 
-    acceptance_prob = math.exp(-delta / temperature)
+    # The cooling schedule precomputes reciprocals, so the hot path can
+    # multiply instead of dividing; fall back to the division for callers
+    # that only provide a temperature.
+    inv_temperature = state.get('inv_temperature')
+    if inv_temperature is not None:
+        acceptance_prob = math.exp(-delta * inv_temperature)
+    else:
+        acceptance_prob = math.exp(-delta / temperature)
     if random.random() < acceptance_prob:
-        main_window.log_message(conf.UI.Log.OPTIMIZER_ACCEPTED_BAD_MOVE.format(new_cost=new_cost, delta=delta, temperature=temperature))
+        main_window.log_message(conf.render_log(conf.UI.Log.OPTIMIZER_ACCEPTED_BAD_MOVE, new_cost=new_cost, delta=delta, temperature=temperature))
         return True
 
     return False
 
-def run_simulated_annealing(main_window: 'MainWindow', possible_moves: List[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> float:
+def run_simulated_annealing(main_window: 'MainWindow', possible_moves: List[Dict[str, Any]], params: Optional[Union[SAParams, Dict[str, Any]]] = None) -> float:
     """
     Runs a simulated annealing optimization algorithm.
 
@@ -212,40 +402,95 @@ def run_simulated_annealing(main_window: 'MainWindow', possible_moves: List[Dict
     Args:
         main_window (MainWindow): The main application window instance.
         possible_moves (List[Dict[str, Any]]): A list of possible optimization moves.
-        params (Dict[str, Any], optional): A dictionary of parameters for the
-            algorithm: 'iterations', 'move_step_grid_units', 'initial_temp', 'cooling_rate'.
+        params (SAParams or Dict[str, Any], optional): The algorithm
+            parameters. A plain dict of SAParams field names is also
+            accepted for backward compatibility.
 
     Returns:
         float: The final cost score of the diagram.
     """
     if params is None:
-        params = {}
+        params = SAParams()
+    elif isinstance(params, dict):
+        params = SAParams(**params)
+
+    # Bind the parameters to locals once before the loop.
+    iterations = params.iterations
+    initial_temp = params.initial_temp
+    cooling_rate = params.cooling_rate
+    reporting_interval = params.reporting_interval
+    move_step = conf.GRID_SIZE * params.move_step_grid_units
+    cost_params = {'intersection_weight': params.intersection_weight,
+                   'wirelength_weight': params.wirelength_weight}
 
-    # Get parameters, using conf.py for defaults
-    iterations = params.get('iterations', conf.OPTIMIZER_SA_DEFAULT_ITERATIONS)
-    move_step_grid_units = params.get('move_step_grid_units', conf.OPTIMIZER_SA_DEFAULT_MOVE_STEP_GRID_UNITS)
-    initial_temp = params.get('initial_temp', conf.OPTIMIZER_SA_DEFAULT_INITIAL_TEMP)
-    cooling_rate = params.get('cooling_rate', conf.OPTIMIZER_SA_DEFAULT_COOLING_RATE)
-    reporting_interval = params.get('reporting_interval', conf.OPTIMIZER_SA_DEFAULT_REPORTING_INTERVAL)
-    move_step = conf.GRID_SIZE * move_step_grid_units
+    n_restarts = max(1, params.n_restarts)
 
     main_window.log_message(conf.UI.Log.OPTIMIZER_SA_PARAMS.format(initial_temp=initial_temp, cooling_rate=cooling_rate))
 
-    # Prepare state and hooks for the generic loop
-    strategy_state = {'temperature': initial_temp}
+    # Precompute the whole cooling schedule once, up front. The geometric
+    # decay is fully determined by the parameters, so the loop just steps
+    # through the table instead of recomputing the temperature each time.
+    # The schedule is immutable and shared by every restart.
+    schedule: List[float] = []
+    temperature = initial_temp
+    for _ in range(iterations):
+        schedule.append(temperature)
+        temperature *= cooling_rate
+    # Reciprocals are precomputed alongside, so the acceptance test in the
+    # hot loop multiplies instead of dividing. Clamp to the frozen
+    # threshold first: the geometric decay underflows to exactly 0.0 for
+    # small cooling rates, and the strategy's frozen guard rejects those
+    # entries before the reciprocal is ever used anyway.
+    inv_schedule: List[float] = [1.0 / max(t, conf.OPTIMIZER_SA_MIN_TEMPERATURE) for t in schedule]
 
     def sa_post_hook(state: Dict[str, Any]) -> None:
-        """Cools the temperature after each iteration."""
-        state['temperature'] *= cooling_rate
-
-    return _run_optimization_loop(
-        main_window,
-        possible_moves,
-        iterations=iterations,
-        move_step=move_step,
-        reporting_interval=reporting_interval,
-        cost_params=params,
-        strategy_func=_simulated_annealing_strategy,
-        strategy_state=strategy_state,
-        post_iteration_hook=sa_post_hook
-    )
+        """Advances to the next precomputed temperature after each iteration."""
+        i = state['iteration'] + 1
+        state['iteration'] = i
+        if i < len(schedule):
+            state['temperature'] = schedule[i]
+            state['inv_temperature'] = inv_schedule[i]
+
+    # Restarts are run sequentially against the live scene: the initial
+    # layout is snapshotted once, each run anneals from that snapshot, and
+    # the best-scoring layout is restored at the end.
+    initial_layout = _snapshot_layout(possible_moves) if n_restarts > 1 else None
+    best_cost: Optional[float] = None
+    best_layout: Optional[List[Tuple]] = None
+
+    for restart in range(n_restarts):
+        if main_window.is_shutting_down:
+            break
+        if restart > 0:
+            _restore_layout(main_window, initial_layout, possible_moves)
+        if n_restarts > 1:
+            main_window.log_message(conf.render_log(conf.UI.Log.OPTIMIZER_SA_RESTART, restart=restart + 1, total_restarts=n_restarts))
+
+        strategy_state = {'temperature': initial_temp,
+                          'inv_temperature': 1.0 / max(initial_temp, conf.OPTIMIZER_SA_MIN_TEMPERATURE),
+                          'schedule': schedule, 'iteration': 0}
+        final_cost = _run_optimization_loop(
+            main_window,
+            possible_moves,
+            iterations=iterations,
+            move_step=move_step,
+            reporting_interval=reporting_interval,
+            cost_params=cost_params,
+            strategy_func=_simulated_annealing_strategy,
+            strategy_state=strategy_state,
+            post_iteration_hook=sa_post_hook,
+            # Deltas beyond temperature * factor have a vanishing acceptance
+            # probability, so scoring can stop once a trial exceeds them.
+            delta_bound_func=lambda state: state['temperature'] * conf.OPTIMIZER_SA_REJECT_DELTA_FACTOR
+        )
+
+        if best_cost is None or final_cost < best_cost:
+            best_cost = final_cost
+            if n_restarts > 1:
+                best_layout = _snapshot_layout(possible_moves)
+
+    if best_layout is not None:
+        _restore_layout(main_window, best_layout, possible_moves)
+        main_window.log_message(conf.render_log(conf.UI.Log.OPTIMIZER_SA_BEST_RESTART, total_restarts=n_restarts, cost=best_cost))
+
+    return best_cost if best_cost is not None else main_window.calculate_diagram_cost(cost_params=cost_params)